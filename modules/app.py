@@ -3,11 +3,13 @@ Main Application Window
 """
 
 import os
-import shutil
+import re
 import csv
 import logging
 import sqlite3
-from datetime import datetime
+from datetime import datetime, timedelta
+from contextlib import contextmanager
+from functools import partial
 from PyQt6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -17,29 +19,309 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QFileDialog,
     QDialog,
+    QInputDialog,
+    QProgressDialog,
 )
-from PyQt6.QtGui import QFont, QAction, QIcon, QKeySequence, QShortcut
+from PyQt6.QtCore import (
+    QObject,
+    QRunnable,
+    QSignalBlocker,
+    Qt,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QAction, QIcon, QKeySequence, QShortcut
 
-from . import __version__, __app_name__, __developer__
-from .styles import ModernStyle
+from . import __version__, __app_name__, __developer__, get_translator
+from .styles import ModernStyle, bold_font
 from .tabs_boxes import BoxesTab
 from .tabs_items import ItemsTab
 from .tabs_history import HistoryTab
 from .tabs_stats import StatsTab
-from .dialogs import ImportPreviewDialog, HelpDialog
+
+
+class CsvExportDialect(csv.excel):
+    """CSV dialect shared by all exports (minimal quoting, Unix line endings)."""
+
+    quoting = csv.QUOTE_MINIMAL
+    lineterminator = "\n"
+
+
+# Static parts of the CSV import template, pre-formatted once at import time
+IMPORT_TEMPLATE_HEADER = "Item Name,Box,Quantity\n"
+IMPORT_TEMPLATE_EXAMPLES = (("Example Item 1", "5"), ("Example Item 2", "10"), ("Example Item 3", "3"))
+IMPORT_TEMPLATE_PLACEHOLDER_ROWS = "".join(
+    f"{name},Box Name Here,{qty}\n" for name, qty in IMPORT_TEMPLATE_EXAMPLES
+)
+IMPORT_TEMPLATE_INSTRUCTIONS = (
+    "\n"
+    "# INSTRUCTIONS:\n"
+    "# 1. Replace example rows with your actual items\n"
+    "# 2. Item Name: Name of the item (required)\n"
+    "# 3. Box: Must match an existing box name exactly (required)\n"
+    '"# 4. Quantity: Number of items, must be 1 or higher (required)"\n'
+    "# 5. Delete these instruction rows before importing\n"
+    "# 6. Use File -> Import from CSV to import this file\n"
+)
+IMPORT_TEMPLATE_NO_BOXES_WARNING = (
+    "\n"
+    "# WARNING: No boxes found in database!\n"
+    "# Create boxes first before importing items.\n"
+)
+
+
+def csv_field(value):
+    """Quote a single CSV field the way csv.QUOTE_MINIMAL would."""
+    if any(c in value for c in ',"\r\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def iter_template_rows(boxes):
+    """Yield the lines of the CSV import template, using real box names if any."""
+    yield IMPORT_TEMPLATE_HEADER
+    if boxes:
+        # Use real box names as examples
+        for (name, qty), (box_name,) in zip(IMPORT_TEMPLATE_EXAMPLES, boxes):
+            yield f"{name},{csv_field(box_name)},{qty}\n"
+    else:
+        # No boxes exist, use placeholder examples
+        yield IMPORT_TEMPLATE_PLACEHOLDER_ROWS
+    yield IMPORT_TEMPLATE_INSTRUCTIONS
+    if not boxes:
+        yield IMPORT_TEMPLATE_NO_BOXES_WARNING
+
+
+class BackupSignals(QObject):
+    """Signals emitted by BackupWorker back on the GUI thread."""
+
+    finished = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+
+class BackupWorker(QRunnable):
+    """Copies the database with SQLite's online backup API on a pool thread."""
+
+    def __init__(self, db_path, backup_path):
+        super().__init__()
+        self.db_path = db_path
+        self.backup_path = backup_path
+        self.signals = BackupSignals()
+
+    def run(self):
+        try:
+            # Dedicated read-only connection; the GUI connection stays on its thread
+            source = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+            try:
+                target = sqlite3.connect(self.backup_path)
+                try:
+                    source.backup(target, pages=1000)
+                finally:
+                    target.close()
+            finally:
+                source.close()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(self.backup_path)
+
+
+class CsvImportSignals(QObject):
+    """Signals emitted by CsvImportWorker back on the GUI thread."""
+
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(list, list)
+    invalid_format = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+
+class CsvImportWorker(QRunnable):
+    """Parses and validates an import CSV on a pool thread."""
+
+    # Signed integer check used to validate CSV quantities without int() exceptions
+    INTEGER_RE = re.compile(r"[+-]?\d+")
+
+    # Rows parsed between progress updates
+    PROGRESS_INTERVAL = 1000
+
+    def __init__(self, file_path, existing_boxes):
+        super().__init__()
+        self.file_path = file_path
+        # casefolded box name -> id, read on the GUI thread's connection
+        self.existing_boxes = existing_boxes
+        self.signals = CsvImportSignals()
+
+    def run(self):
+        try:
+            import_data = []
+            validation_errors = []
+
+            total_bytes = os.path.getsize(self.file_path) or 1
+            with open(self.file_path, "r", newline="", encoding="utf-8") as csvfile:
+                reader = csv.DictReader(csvfile)
+                # Byte position of the underlying buffer; text tell() is unusable mid-iteration
+                position = csvfile.buffer.tell
+                last_percent = 0
+
+                # Validate header
+                required_headers = ["Item Name", "Box", "Quantity"]
+                is_integer = self.INTEGER_RE.fullmatch
+                fieldnames = reader.fieldnames or []
+                if not all(header in fieldnames for header in required_headers):
+                    self.signals.invalid_format.emit(
+                        f"CSV must contain headers: {', '.join(required_headers)}\n"
+                        f"Found headers: {', '.join(fieldnames)}"
+                    )
+                    return
+
+                for row_num, row in enumerate(
+                    reader, start=2
+                ):  # Start at 2 (1 for header)
+                    item_name = row.get("Item Name", "").strip()
+                    box_name = row.get("Box", "").strip()
+                    quantity_str = row.get("Quantity", "").strip()
+                    box_key = box_name.casefold()
+
+                    if row_num % self.PROGRESS_INTERVAL == 0:
+                        percent = position() * 100 // total_bytes
+                        if percent != last_percent:
+                            last_percent = percent
+                            self.signals.progress.emit(percent)
+
+                    item_error = False
+
+                    # Validate item name
+                    if not item_name:
+                        validation_errors.append(f"Row {row_num}: Item name is empty")
+                        item_error = True
+
+                    # Validate box
+                    if not box_name:
+                        validation_errors.append(f"Row {row_num}: Box name is empty")
+                        item_error = True
+                    elif box_key not in self.existing_boxes:
+                        validation_errors.append(
+                            f"Row {row_num}: Box '{box_name}' does not exist. Create it first."
+                        )
+                        item_error = True
+
+                    # Validate quantity
+                    if is_integer(quantity_str):
+                        quantity = int(quantity_str)
+                        if quantity < 1:
+                            validation_errors.append(
+                                f"Row {row_num}: Quantity must be at least 1"
+                            )
+                            item_error = True
+                    else:
+                        validation_errors.append(
+                            f"Row {row_num}: Invalid quantity '{quantity_str}' (must be a number)"
+                        )
+                        item_error = True
+                        quantity = 0
+
+                    # Add to import data as (row, name, box_name, box_id, quantity, error)
+                    import_data.append(
+                        (
+                            row_num,
+                            item_name,
+                            box_name,
+                            self.existing_boxes.get(box_key),
+                            quantity,
+                            item_error,
+                        )
+                    )
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(import_data, validation_errors)
 
 
 class InventoryApp(QMainWindow):
     """Main application window."""
 
+    # Database file; pool-thread readers must open the same file the GUI writes
+    DB_PATH = "inventory.db"
+
+    # Audit log rows are committed in batches: when this many are pending,
+    # or when the flush timer fires, whichever comes first
+    AUDIT_FLUSH_THRESHOLD = 50
+    AUDIT_FLUSH_INTERVAL_MS = 2000
+
+    # Trigram FTS5 indexes kept in sync by triggers: (table, columns)
+    SEARCH_INDEXES = (
+        ("boxes", ("name", "location")),
+        ("items", ("name",)),
+        ("audit_logs", ("entity_name",)),
+    )
+    # Trigram index needs at least three characters to match anything
+    FTS_MIN_QUERY_LENGTH = 3
+
+    # Static dialog texts, built once
+    ABOUT_TITLE = f"About {__app_name__}"
+    ABOUT_HTML = f"""
+        <h2>{__app_name__}</h2>
+        <p><b>Version:</b> {__version__}</p>
+        <p><b>Developer:</b> {__developer__}</p>
+        <p>A modern inventory management system with comprehensive logging and audit trails.</p>
+
+        <h3>Features:</h3>
+        <ul>
+            <li>✓ Manage items and storage boxes</li>
+            <li>✓ Search and filter capabilities</li>
+            <li>✓ CSV import/export functionality</li>
+            <li>✓ Complete audit log and transaction history</li>
+            <li>✓ Automatic database backups</li>
+            <li>✓ Dark & Light theme support</li>
+            <li>✓ Keyboard shortcuts for power users</li>
+        </ul>
+
+        <p><b>Database:</b> SQLite</p>
+        <p><b>Framework:</b> PyQt6</p>
+        <p><b>Press F1 for detailed help</b></p>
+        """
+    LANGUAGE_CHANGED_MSG = (
+        "Language has been changed. Please restart the application for changes to take effect."
+    )
+    THEME_CHANGED_MSG = (
+        "Theme changed to {theme} mode.\nSome elements may require a restart to fully update."
+    )
+
+    # Backup filenames: inventory_backup_YYYY-MM-DD_HH-MM-SS.db
+    BACKUP_FILENAME_RE = re.compile(
+        r"inventory_backup_(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})\.db$"
+    )
+
+    AUDIT_INSERT_SQL = """
+        INSERT INTO audit_logs
+        (timestamp, action, entity_type, entity_id, entity_name, details, old_value, new_value)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
     def __init__(self):
         super().__init__()
         self.setMinimumSize(1200, 800)
 
+        # Background backup in flight, if any
+        self._backup_worker = None
+        self._import_worker = None
+        self._import_progress = None
+
+        # In-memory copy of the settings table, loaded on first access
+        self._settings_cache = None
+
+        # Bumped after every committed change to boxes or items
+        self.data_version = 0
+
+        self.translator = get_translator()
+
         # Setup database
-        self.conn = sqlite3.connect("inventory.db")
+        # Larger statement cache: tabs reuse a fixed set of query strings
+        self.conn = sqlite3.connect(self.DB_PATH, cached_statements=256)
         self.cursor = self.conn.cursor()
         self.setup_database()
+        self.optimize_database(initial=True)
 
         # Load language preference
         self.load_language_preference()
@@ -80,113 +362,229 @@ class InventoryApp(QMainWindow):
         self.setup_logging()
 
         self.logger.info("=== Database Setup Started ===")
-        self.logger.info("Creating/verifying database tables...")
-
-        self.cursor.execute(
-            """
-        CREATE TABLE IF NOT EXISTS boxes (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            location TEXT
-        )
-        """
-        )
-        self.logger.info("Boxes table verified")
 
-        # Add location column if it doesn't exist (migration for existing databases)
-        try:
+        # Buffered audit log commits
+        self._pending_audit_rows = 0
+        self.audit_flush_timer = QTimer(self)
+        self.audit_flush_timer.setSingleShot(True)
+        self.audit_flush_timer.setInterval(self.AUDIT_FLUSH_INTERVAL_MS)
+        self.audit_flush_timer.timeout.connect(self.flush_audit_log)
+
+        # Add location column if it doesn't exist (migration for existing databases).
+        # Runs before the schema script so idx_boxes_location can always be created.
+        self.cursor.execute("PRAGMA table_info(boxes)")
+        box_columns = {row[1] for row in self.cursor.fetchall()}
+        if not box_columns:
+            # New database: the schema script creates boxes with the column
+            self.logger.debug("Database migration: boxes table is new, nothing to migrate")
+        elif "location" not in box_columns:
             self.cursor.execute("ALTER TABLE boxes ADD COLUMN location TEXT")
             self.conn.commit()
             self.logger.info(
                 "Database migration: Added 'location' column to boxes table"
             )
-        except sqlite3.OperationalError:
-            # Column already exists
-            self.logger.info("Database migration: 'location' column already exists")
+        else:
+            self.logger.debug("Database migration: 'location' column already exists")
 
-        self.cursor.execute(
+        # Connection tuning, schema and indexes in a single script
+        self.logger.debug("Creating/verifying database tables and indexes...")
+        self.cursor.executescript(
             """
-        CREATE TABLE IF NOT EXISTS items (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            box_id INTEGER,
-            quantity INTEGER DEFAULT 1 CHECK(quantity > 0),
-            FOREIGN KEY (box_id) REFERENCES boxes(id) ON DELETE CASCADE
-        )
-        """
-        )
-        self.logger.info("Items table verified")
-
-        # Audit logs table
-        self.cursor.execute(
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            PRAGMA temp_store = MEMORY;
+            PRAGMA cache_size = -20000;
+            PRAGMA mmap_size = 134217728;
+            PRAGMA wal_autocheckpoint = 1000;
+            PRAGMA foreign_keys = ON;
+
+            CREATE TABLE IF NOT EXISTS boxes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                location TEXT
+            );
+
+            CREATE TABLE IF NOT EXISTS items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                box_id INTEGER,
+                quantity INTEGER DEFAULT 1 CHECK(quantity > 0),
+                FOREIGN KEY (box_id) REFERENCES boxes(id) ON DELETE CASCADE
+            );
+
+            CREATE TABLE IF NOT EXISTS audit_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                action TEXT NOT NULL,
+                entity_type TEXT NOT NULL,
+                entity_id INTEGER,
+                entity_name TEXT,
+                details TEXT,
+                old_value TEXT,
+                new_value TEXT
+            );
+
+            CREATE TABLE IF NOT EXISTS settings (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_boxes_name ON boxes(name);
+            CREATE INDEX IF NOT EXISTS idx_boxes_name_nocase ON boxes(name COLLATE NOCASE);
+            CREATE INDEX IF NOT EXISTS idx_boxes_location ON boxes(location);
+            CREATE INDEX IF NOT EXISTS idx_items_name ON items(name);
+            -- Covers per-box COUNT/SUM(quantity) for the Stats tab; replaces idx_items_box_id
+            CREATE INDEX IF NOT EXISTS idx_items_box_quantity ON items(box_id, quantity);
+            DROP INDEX IF EXISTS idx_items_box_id;
+            CREATE INDEX IF NOT EXISTS idx_audit_logs_timestamp ON audit_logs(timestamp);
+            -- History filters page by id within one action / entity type
+            CREATE INDEX IF NOT EXISTS idx_audit_logs_action_id ON audit_logs(action, id);
+            CREATE INDEX IF NOT EXISTS idx_audit_logs_type_id ON audit_logs(entity_type, id);
+
+            -- Row counts kept up to date by triggers (avoids COUNT(*) scans)
+            CREATE TABLE IF NOT EXISTS entity_counts (
+                entity TEXT PRIMARY KEY,
+                n INTEGER NOT NULL
+            );
+
+            CREATE TRIGGER IF NOT EXISTS trg_boxes_count_insert AFTER INSERT ON boxes
+            BEGIN UPDATE entity_counts SET n = n + 1 WHERE entity = 'boxes'; END;
+            CREATE TRIGGER IF NOT EXISTS trg_boxes_count_delete AFTER DELETE ON boxes
+            BEGIN UPDATE entity_counts SET n = n - 1 WHERE entity = 'boxes'; END;
+            CREATE TRIGGER IF NOT EXISTS trg_items_count_insert AFTER INSERT ON items
+            BEGIN UPDATE entity_counts SET n = n + 1 WHERE entity = 'items'; END;
+            CREATE TRIGGER IF NOT EXISTS trg_items_count_delete AFTER DELETE ON items
+            BEGIN UPDATE entity_counts SET n = n - 1 WHERE entity = 'items'; END;
+            CREATE TRIGGER IF NOT EXISTS trg_audit_logs_count_insert AFTER INSERT ON audit_logs
+            BEGIN UPDATE entity_counts SET n = n + 1 WHERE entity = 'audit_logs'; END;
+            CREATE TRIGGER IF NOT EXISTS trg_audit_logs_count_delete AFTER DELETE ON audit_logs
+            BEGIN UPDATE entity_counts SET n = n - 1 WHERE entity = 'audit_logs'; END;
             """
-        CREATE TABLE IF NOT EXISTS audit_logs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp TEXT NOT NULL,
-            action TEXT NOT NULL,
-            entity_type TEXT NOT NULL,
-            entity_id INTEGER,
-            entity_name TEXT,
-            details TEXT,
-            old_value TEXT,
-            new_value TEXT
         )
-        """
+        self.logger.debug("Database pragmas applied (WAL, synchronous=NORMAL, foreign keys)")
+        self.logger.debug("Database tables and indexes verified")
+        self.setup_search_index()
+        self.logger.info("=== Database Setup Complete ===")
+
+        # Log database statistics
+        counts = self.get_entity_counts()
+        box_count = counts["boxes"]
+        item_count = counts["items"]
+        log_count = counts["audit_logs"]
+        self.logger.info(
+            f"Database statistics: {box_count} boxes, {item_count} items, {log_count} audit logs"
         )
-        self.logger.info("Audit logs table verified")
 
-        self.cursor.execute("PRAGMA foreign_keys = ON")
-        self.conn.commit()
-        self.logger.info("Foreign keys enabled")
+    def setup_search_index(self):
+        """Create the trigram FTS5 indexes used for substring searches.
 
-        # Create indexes for better search performance
-        self.logger.info("Creating database indexes...")
+        Sets fts_enabled; searches fall back to LIKE when the SQLite build
+        has no FTS5 or trigram tokenizer.
+        """
         try:
-            self.cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_boxes_name ON boxes(name)"
-            )
-            self.logger.info("Index created: idx_boxes_name")
+            for table, columns in self.SEARCH_INDEXES:
+                self.create_search_index(table, columns)
+            self.fts_enabled = True
         except sqlite3.OperationalError as e:
-            self.logger.warning(f"Index creation warning for boxes.name: {e}")
+            self.logger.warning(f"FTS5 trigram search unavailable, using LIKE: {e}")
+            self.fts_enabled = False
 
-        try:
-            self.cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_boxes_location ON boxes(location)"
-            )
-            self.logger.info("Index created: idx_boxes_location")
-        except sqlite3.OperationalError as e:
-            self.logger.warning(f"Index creation warning for boxes.location: {e}")
+    def create_search_index(self, table, columns):
+        """Create <table>_fts over columns, with triggers keeping it in sync."""
+        fts = f"{table}_fts"
+        self.cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (fts,)
+        )
+        exists = self.cursor.fetchone() is not None
+
+        names = ", ".join(columns)
+        new_values = ", ".join(f"new.{column}" for column in columns)
+        old_values = ", ".join(f"old.{column}" for column in columns)
+        self.cursor.executescript(
+            f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+                {names},
+                content='{table}', content_rowid='id', tokenize='trigram'
+            );
+
+            CREATE TRIGGER IF NOT EXISTS trg_{fts}_insert AFTER INSERT ON {table}
+            BEGIN
+                INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new_values});
+            END;
+            CREATE TRIGGER IF NOT EXISTS trg_{fts}_delete AFTER DELETE ON {table}
+            BEGIN
+                INSERT INTO {fts}({fts}, rowid, {names})
+                VALUES ('delete', old.id, {old_values});
+            END;
+            CREATE TRIGGER IF NOT EXISTS trg_{fts}_update AFTER UPDATE OF {names} ON {table}
+            BEGIN
+                INSERT INTO {fts}({fts}, rowid, {names})
+                VALUES ('delete', old.id, {old_values});
+                INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new_values});
+            END;
+            """
+        )
+        if not exists:
+            # Index rows created before the search table existed
+            self.logger.info(f"Building {fts} search index")
+            self.cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+            self.conn.commit()
 
-        try:
-            self.cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_items_name ON items(name)"
+    def fts_query(self, search_text):
+        """Return an FTS5 phrase for search_text, or None to search with LIKE."""
+        if not self.fts_enabled or len(search_text) < self.FTS_MIN_QUERY_LENGTH:
+            return None
+        return '"' + search_text.replace('"', '""') + '"'
+
+    def get_entity_counts(self):
+        """Return cached row counts for boxes, items and audit_logs."""
+        self.cursor.execute("SELECT entity, n FROM entity_counts")
+        counts = dict(self.cursor.fetchall())
+        if len(counts) < 3:
+            # First run with the counts table: seed it once from the real tables
+            self.logger.info("Seeding entity_counts table")
+            self.cursor.executescript(
+                """
+                BEGIN;
+                DELETE FROM entity_counts;
+                INSERT INTO entity_counts SELECT 'boxes', COUNT(*) FROM boxes;
+                INSERT INTO entity_counts SELECT 'items', COUNT(*) FROM items;
+                INSERT INTO entity_counts SELECT 'audit_logs', COUNT(*) FROM audit_logs;
+                COMMIT;
+                """
             )
-            self.logger.info("Index created: idx_items_name")
-        except sqlite3.OperationalError as e:
-            self.logger.warning(f"Index creation warning for items.name: {e}")
+            self.cursor.execute("SELECT entity, n FROM entity_counts")
+            counts = dict(self.cursor.fetchall())
+        return counts
 
+    def optimize_database(self, initial=False):
+        """Run PRAGMA optimize so the query planner works with fresh statistics."""
         try:
-            self.cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_items_box_id ON items(box_id)"
-            )
-            self.logger.info("Index created: idx_items_box_id")
-        except sqlite3.OperationalError as e:
-            self.logger.warning(f"Index creation warning for items.box_id: {e}")
-
-        self.conn.commit()
-        self.logger.info("Database indexes created successfully")
-        self.logger.info("=== Database Setup Complete ===")
+            if initial:
+                # Aggressive one-off pass when no statistics have been gathered yet
+                self.cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+                )
+                has_stats = self.cursor.fetchone() is not None
+                if has_stats:
+                    self.cursor.execute("SELECT 1 FROM sqlite_stat1 LIMIT 1")
+                    has_stats = self.cursor.fetchone() is not None
+                if has_stats:
+                    return
+                self.cursor.execute("PRAGMA optimize=0x10002")
+            else:
+                self.cursor.execute("PRAGMA optimize")
+            self.logger.debug("Database optimize completed")
+        except sqlite3.Error as e:
+            self.logger.warning(f"Database optimize failed: {e}")
 
-        # Log database statistics
-        self.cursor.execute("SELECT COUNT(*) FROM boxes")
-        box_count = self.cursor.fetchone()[0]
-        self.cursor.execute("SELECT COUNT(*) FROM items")
-        item_count = self.cursor.fetchone()[0]
-        self.cursor.execute("SELECT COUNT(*) FROM audit_logs")
-        log_count = self.cursor.fetchone()[0]
-        self.logger.info(
-            f"Database statistics: {box_count} boxes, {item_count} items, {log_count} audit logs"
-        )
+    def checkpoint_wal(self, mode="PASSIVE"):
+        """Checkpoint the write-ahead log back into the main database file."""
+        try:
+            self.cursor.execute(f"PRAGMA wal_checkpoint({mode})")
+            self.logger.debug(f"WAL checkpoint ({mode}) completed")
+        except sqlite3.Error as e:
+            self.logger.warning(f"WAL checkpoint ({mode}) failed: {e}")
 
     def setup_logging(self):
         """Setup file-based logging."""
@@ -197,15 +595,21 @@ class InventoryApp(QMainWindow):
         # Setup logger with UTF-8 encoding
         log_filename = f"logs/inventory_{datetime.now().strftime('%Y-%m-%d')}.log"
 
+        # Log level defaults to INFO; INVENTORY_LOG=DEBUG (etc.) overrides it
+        level_name = os.environ.get("INVENTORY_LOG", "INFO").upper()
+        log_level = logging.getLevelName(level_name)
+        if not isinstance(log_level, int):
+            log_level = logging.INFO
+
         # Create handlers with proper encoding
         file_handler = logging.FileHandler(log_filename, encoding="utf-8")
-        file_handler.setLevel(logging.INFO)
+        file_handler.setLevel(log_level)
 
         # StreamHandler with UTF-8 for console (handles Windows encoding issues)
         import sys
 
         stream_handler = logging.StreamHandler(sys.stdout)
-        stream_handler.setLevel(logging.INFO)
+        stream_handler.setLevel(log_level)
 
         # Create formatter
         formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
@@ -214,7 +618,7 @@ class InventoryApp(QMainWindow):
 
         # Configure logging
         logging.basicConfig(
-            level=logging.INFO,
+            level=log_level,
             handlers=[file_handler, stream_handler],
         )
 
@@ -232,46 +636,98 @@ class InventoryApp(QMainWindow):
         new_value=None,
     ):
         """Log an action to the database and file."""
+        self.log_actions([{
+            "action": action,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "entity_name": entity_name,
+            "details": details,
+            "old_value": old_value,
+            "new_value": new_value,
+        }])
+
+    def log_actions(self, entries):
+        """Log several actions with one executemany; entries are log_action kwargs."""
+        entries = list(entries)
+        if not entries:
+            return
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-        # Log to database
-        self.cursor.execute(
-            """
-            INSERT INTO audit_logs
-            (timestamp, action, entity_type, entity_id, entity_name, details, old_value, new_value)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                timestamp,
-                action,
-                entity_type,
-                entity_id,
-                entity_name,
-                details,
-                old_value,
-                new_value,
-            ),
+        # Log to database (commit is deferred, see flush_audit_log)
+        self.cursor.executemany(
+            self.AUDIT_INSERT_SQL,
+            [
+                (
+                    timestamp,
+                    entry["action"],
+                    entry["entity_type"],
+                    entry.get("entity_id"),
+                    entry.get("entity_name"),
+                    entry.get("details"),
+                    entry.get("old_value"),
+                    entry.get("new_value"),
+                )
+                for entry in entries
+            ],
         )
-        self.conn.commit()
+        self._pending_audit_rows += len(entries)
+        if self._pending_audit_rows >= self.AUDIT_FLUSH_THRESHOLD:
+            self.flush_audit_log()
+        elif not self.audit_flush_timer.isActive():
+            self.audit_flush_timer.start()
+
+        # Log to file (with safe encoding for console); skip formatting when filtered
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
+        for entry in entries:
+            entity_name = entry.get("entity_name")
+            entity_id = entry.get("entity_id")
+            details = entry.get("details")
+            log_message = (
+                f"{entry['action']} - {entry['entity_type']}"
+                + (f" '{entity_name}'" if entity_name else "")
+                + (f" (ID: {entity_id})" if entity_id else "")
+                + (f" - {details}" if details else "")
+            )
 
-        # Log to file (with safe encoding for console)
-        log_message = f"{action} - {entity_type}"
-        if entity_name:
-            log_message += f" '{entity_name}'"
-        if entity_id:
-            log_message += f" (ID: {entity_id})"
-        if details:
-            log_message += f" - {details}"
+            # Safe logging that handles Unicode issues on Windows console
+            try:
+                self.logger.info(log_message)
+            except UnicodeEncodeError:
+                # Fallback: replace problematic characters for console output
+                safe_message = (
+                    log_message.replace("→", "->").replace("✓", "OK").replace("⚠", "WARN")
+                )
+                self.logger.info(safe_message)
 
-        # Safe logging that handles Unicode issues on Windows console
+    def flush_audit_log(self):
+        """Commit any buffered audit log rows."""
+        self.audit_flush_timer.stop()
+        if not self._pending_audit_rows:
+            return
         try:
-            self.logger.info(log_message)
-        except UnicodeEncodeError:
-            # Fallback: replace problematic characters for console output
-            safe_message = (
-                log_message.replace("→", "->").replace("✓", "OK").replace("⚠", "WARN")
-            )
-            self.logger.info(safe_message)
+            self.conn.commit()
+        except sqlite3.Error as e:
+            # Don't leave an open transaction pinning the WAL
+            self.conn.rollback()
+            self.logger.error(f"Failed to commit audit log rows: {e}")
+        self._pending_audit_rows = 0
+
+    @contextmanager
+    def transaction(self):
+        """Run the enclosed writes (audit rows included) in a single transaction."""
+        self.flush_audit_log()
+        self.cursor.execute("BEGIN")
+        try:
+            yield
+        except Exception:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+        # Any audit rows logged inside the block are committed now
+        self._pending_audit_rows = 0
+        self.audit_flush_timer.stop()
 
     def setup_ui(self):
         """Setup the main UI."""
@@ -279,36 +735,21 @@ class InventoryApp(QMainWindow):
 
         # Create menu bar
         menubar = self.menuBar()
-        file_menu = menubar.addMenu(tr.tr("menu_file"))
-
-        # Backup action
-        backup_action = QAction(tr.tr("menu_backup"), self)
-        backup_action.triggered.connect(self.backup_database)
-        file_menu.addAction(backup_action)
-
-        # Export to CSV action
-        export_action = QAction(tr.tr("menu_export_inventory"), self)
-        export_action.triggered.connect(self.export_to_csv)
-        file_menu.addAction(export_action)
-
-        # Export logs action
-        export_logs_action = QAction(tr.tr("menu_export_logs"), self)
-        export_logs_action.triggered.connect(self.export_logs_to_csv)
-        file_menu.addAction(export_logs_action)
 
-        file_menu.addSeparator()
-
-        # Import CSV action
-        import_action = QAction(tr.tr("menu_import"), self)
-        import_action.triggered.connect(self.import_from_csv)
-        file_menu.addAction(import_action)
-
-        file_menu.addSeparator()
-
-        # Exit action
-        exit_action = QAction(tr.tr("menu_exit"), self)
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
+        # File menu (None entries are separators)
+        file_menu = menubar.addMenu(tr.tr("menu_file"))
+        self.add_menu_actions(
+            file_menu,
+            [
+                (tr.tr("menu_backup"), None, self.backup_database),
+                (tr.tr("menu_export_inventory"), None, self.export_to_csv),
+                (tr.tr("menu_export_logs"), None, self.export_logs_to_csv),
+                None,
+                (tr.tr("menu_import"), None, self.import_from_csv),
+                None,
+                (tr.tr("menu_exit"), None, self.close),
+            ],
+        )
 
         # Language menu
         language_menu = menubar.addMenu(tr.tr("menu_language"))
@@ -326,13 +767,13 @@ class InventoryApp(QMainWindow):
         self.language_action_group.setExclusive(True)
 
         # Add language actions
+        current_lang = self.get_current_language()
         for lang_code, lang_name in languages.items():
             lang_action = QAction(lang_name, self)
             lang_action.setCheckable(True)
             lang_action.setData(lang_code)
 
             # Check if this is the current language
-            current_lang = self.get_current_language()
             if lang_code == current_lang:
                 lang_action.setChecked(True)
 
@@ -344,33 +785,21 @@ class InventoryApp(QMainWindow):
 
         # View menu
         view_menu = menubar.addMenu("View")
-
-        # Theme toggle action
-        self.theme_action = QAction("Switch to Light Theme", self)
-        self.theme_action.setShortcut("Ctrl+T")
-        self.theme_action.triggered.connect(self.toggle_theme)
-        view_menu.addAction(self.theme_action)
+        (self.theme_action,) = self.add_menu_actions(
+            view_menu, [("Switch to Light Theme", "Ctrl+T", self.toggle_theme)]
+        )
 
         # Help menu
         help_menu = menubar.addMenu(tr.tr("menu_help"))
-
-        # Help action
-        help_action = QAction("Help & Documentation", self)
-        help_action.setShortcut("F1")
-        help_action.triggered.connect(self.show_help)
-        help_menu.addAction(help_action)
-
-        # Export import template
-        template_action = QAction("Export CSV Import Template", self)
-        template_action.triggered.connect(self.export_import_template)
-        help_menu.addAction(template_action)
-
-        help_menu.addSeparator()
-
-        # About action
-        about_action = QAction(tr.tr("menu_about"), self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
+        self.add_menu_actions(
+            help_menu,
+            [
+                ("Help & Documentation", "F1", self.show_help),
+                ("Export CSV Import Template", None, self.export_import_template),
+                None,
+                (tr.tr("menu_about"), None, self.show_about),
+            ],
+        )
 
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -380,56 +809,105 @@ class InventoryApp(QMainWindow):
 
         # Title
         title = QLabel(tr.tr("app_name"))
-        title.setFont(QFont("Arial", 24, QFont.Weight.Bold))
+        title.setFont(bold_font(24))
         layout.addWidget(title)
 
         # Tabs
         self.tabs = QTabWidget()
-        self.tabs.addTab(BoxesTab(self), tr.tr("tab_boxes"))
-        self.tabs.addTab(ItemsTab(self), tr.tr("tab_items"))
-        self.tabs.addTab(HistoryTab(self), tr.tr("tab_history"))
-        self.tabs.addTab(StatsTab(self), tr.tr("tab_stats"))
+        self.boxes_tab = BoxesTab(self)
+        self.tabs.addTab(self.boxes_tab, tr.tr("tab_boxes"))
+
+        # Items, History and Stats are built on first activation (placeholders until then)
+        self.items_tab = None
+        self.history_tab = None
+        self.stats_tab = None
+        self._lazy_tabs = {
+            1: (ItemsTab, "items_tab"),
+            2: (HistoryTab, "history_tab"),
+            3: (StatsTab, "stats_tab"),
+        }
+        self.tabs.addTab(QWidget(), tr.tr("tab_items"))
+        self.tabs.addTab(QWidget(), tr.tr("tab_history"))
+        self.tabs.addTab(QWidget(), tr.tr("tab_stats"))
+        self.tabs.currentChanged.connect(self.ensure_tab)
 
         layout.addWidget(self.tabs)
 
+        # Periodically refresh query planner statistics (every 4 hours)
+        self.optimize_timer = QTimer(self)
+        self.optimize_timer.timeout.connect(self.optimize_database)
+        self.optimize_timer.start(4 * 60 * 60 * 1000)
+
+        # Checkpoint the WAL during idle time so it doesn't grow unbounded (every 5 minutes)
+        self.checkpoint_timer = QTimer(self)
+        self.checkpoint_timer.timeout.connect(self.checkpoint_wal)
+        self.checkpoint_timer.start(5 * 60 * 1000)
+
         # Setup keyboard shortcuts
         self.setup_shortcuts()
 
         # Load theme preference
         self.load_theme_preference()
 
+    def ensure_tab(self, index):
+        """Swap a placeholder tab for its real widget the first time it is shown."""
+        lazy = self._lazy_tabs.pop(index, None)
+        if lazy is None:
+            return
+
+        tab_class, attr_name = lazy
+        self.logger.info(f"Creating {tab_class.__name__} on first activation")
+        tab = tab_class(self)
+        setattr(self, attr_name, tab)
+
+        label = self.tabs.tabText(index)
+        placeholder = self.tabs.widget(index)
+        with QSignalBlocker(self.tabs):
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, tab, label)
+            self.tabs.setCurrentIndex(index)
+        placeholder.deleteLater()
+
+    def add_menu_actions(self, menu, entries):
+        """Add (label, shortcut, slot) actions to a menu; None adds a separator."""
+        actions = []
+        for entry in entries:
+            if entry is None:
+                menu.addSeparator()
+                continue
+            label, shortcut, slot = entry
+            action = QAction(label, self)
+            if shortcut:
+                action.setShortcut(shortcut)
+            action.triggered.connect(slot)
+            menu.addAction(action)
+            actions.append(action)
+        return actions
+
     def get_latest_backup_date(self):
         """Get the date of the most recent backup."""
         backup_folder = "backup"
         if not os.path.exists(backup_folder):
             return None
 
-        # Get all backup files
-        backup_files = [
-            f
-            for f in os.listdir(backup_folder)
-            if f.startswith("inventory_backup_") and f.endswith(".db")
-        ]
-
-        if not backup_files:
+        # The timestamp format sorts lexicographically, so compare the raw
+        # strings and only parse the most recent one
+        latest_timestamp = None
+        with os.scandir(backup_folder) as entries:
+            for entry in entries:
+                match = self.BACKUP_FILENAME_RE.match(entry.name)
+                if match and (
+                    latest_timestamp is None or match.group(1) > latest_timestamp
+                ):
+                    latest_timestamp = match.group(1)
+
+        if latest_timestamp is None:
             return None
 
-        # Extract timestamps from filenames and find the most recent
-        latest_date = None
-        for filename in backup_files:
-            try:
-                # Extract timestamp from filename: inventory_backup_YYYY-MM-DD_HH-MM-SS.db
-                timestamp_str = filename.replace("inventory_backup_", "").replace(
-                    ".db", ""
-                )
-                backup_date = datetime.strptime(timestamp_str, "%Y-%m-%d_%H-%M-%S")
-
-                if latest_date is None or backup_date > latest_date:
-                    latest_date = backup_date
-            except ValueError:
-                continue
-
-        return latest_date
+        try:
+            return datetime.strptime(latest_timestamp, "%Y-%m-%d_%H-%M-%S")
+        except ValueError:
+            return None
 
     def check_backup_status(self):
         """Check if a backup was made in the last 7 days and notify user if not."""
@@ -461,6 +939,10 @@ class InventoryApp(QMainWindow):
 
     def backup_database(self):
         """Backup the database to backup folder with timestamp."""
+        if self._backup_worker is not None:
+            self.logger.info("Backup already in progress, ignoring request")
+            return
+
         self.logger.info("=== Backup Database Started ===")
         try:
             # Create backup folder if it doesn't exist
@@ -475,30 +957,46 @@ class InventoryApp(QMainWindow):
             backup_path = os.path.join(backup_folder, backup_filename)
             self.logger.info(f"Backup destination: {backup_path}")
 
-            # Copy the database file
-            shutil.copy2("inventory.db", backup_path)
-            self.logger.info("Database file copied successfully")
-
-            # Log the backup
-            self.log_action(
-                action="BACKUP",
-                entity_type="DATABASE",
-                details=f"Database backed up to {backup_filename}",
-            )
+            # Make everything committed visible to the worker's own connection
+            self.flush_audit_log()
+            self.checkpoint_wal("TRUNCATE")
 
-            self.logger.info("Showing backup success dialog")
-            QMessageBox.information(
-                self,
-                "Backup Successful",
-                f"Database backed up successfully to:\n{backup_path}",
-            )
-            self.logger.info("=== Backup Database Complete ===")
+            # Copy the database on a pool thread; results come back via signals
+            self._backup_worker = BackupWorker(self.DB_PATH, backup_path)
+            self._backup_worker.signals.finished.connect(self.on_backup_finished)
+            self._backup_worker.signals.failed.connect(self.on_backup_failed)
+            QThreadPool.globalInstance().start(self._backup_worker)
         except Exception as e:
-            self.logger.error(f"Backup failed with error: {str(e)}")
-            QMessageBox.critical(
-                self, "Backup Failed", f"Failed to backup database:\n{str(e)}"
-            )
-            self.logger.info("Backup error dialog closed")
+            self.on_backup_failed(str(e))
+
+    def on_backup_finished(self, backup_path):
+        """Log and report a completed background backup."""
+        self._backup_worker = None
+        self.logger.info("Database backup written successfully")
+
+        # Log the backup
+        self.log_action(
+            action="BACKUP",
+            entity_type="DATABASE",
+            details=f"Database backed up to {os.path.basename(backup_path)}",
+        )
+
+        self.logger.info("Showing backup success dialog")
+        QMessageBox.information(
+            self,
+            "Backup Successful",
+            f"Database backed up successfully to:\n{backup_path}",
+        )
+        self.logger.info("=== Backup Database Complete ===")
+
+    def on_backup_failed(self, error):
+        """Report a failed backup."""
+        self._backup_worker = None
+        self.logger.error(f"Backup failed with error: {error}")
+        QMessageBox.critical(
+            self, "Backup Failed", f"Failed to backup database:\n{error}"
+        )
+        self.logger.info("Backup error dialog closed")
 
     def export_to_csv(self):
         """Export inventory data to CSV file."""
@@ -518,36 +1016,31 @@ class InventoryApp(QMainWindow):
         self.logger.info(f"Export destination: {file_path}")
         try:
             with open(file_path, "w", newline="", encoding="utf-8") as csvfile:
-                writer = csv.writer(csvfile)
+                writer = csv.writer(csvfile, dialect=CsvExportDialect)
 
                 # Write header
                 writer.writerow(["ID", "Item Name", "Box", "Quantity"])
                 self.logger.info("CSV header written")
 
-                # Get all items with box names
+                # Get all items with box names (missing boxes resolved in SQL)
                 self.cursor.execute(
                     """
-                    SELECT items.id, items.name, boxes.name, items.quantity
+                    SELECT items.id, items.name, COALESCE(boxes.name, 'N/A'), items.quantity
                     FROM items
                     LEFT JOIN boxes ON items.box_id = boxes.id
                     ORDER BY items.id
                 """
                 )
 
-                items = self.cursor.fetchall()
-                self.logger.info(f"Retrieved {len(items)} items for export")
-
-                # Write data
-                for item in items:
-                    writer.writerow([item[0], item[1], item[2] or "N/A", item[3]])
+                item_count = self.write_cursor_rows(writer)
 
-            self.logger.info(f"Wrote {len(items)} items to CSV file")
+            self.logger.info(f"Wrote {item_count} items to CSV file")
 
             # Log the export
             self.log_action(
                 action="EXPORT",
                 entity_type="INVENTORY",
-                details=f"Exported {len(items)} items to CSV",
+                details=f"Exported {item_count} items to CSV",
             )
 
             self.logger.info("Showing export success dialog")
@@ -564,8 +1057,23 @@ class InventoryApp(QMainWindow):
             )
             self.logger.info("Export error dialog closed")
 
+    def write_cursor_rows(self, writer, batch_size=10000):
+        """Stream the current cursor result set to a CSV writer in batches."""
+        row_count = 0
+        while True:
+            batch = self.cursor.fetchmany(batch_size)
+            if not batch:
+                break
+            writer.writerows(batch)
+            row_count += len(batch)
+        return row_count
+
     def import_from_csv(self):
         """Import inventory data from CSV file with validation."""
+        if self._import_worker is not None:
+            self.logger.info("CSV import already in progress, ignoring request")
+            return
+
         # Let user choose file
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Import from CSV", "", "CSV Files (*.csv)"
@@ -575,106 +1083,90 @@ class InventoryApp(QMainWindow):
             return
 
         try:
-            import_data = []
-            validation_errors = []
-
             # Get all existing boxes for validation
             self.cursor.execute("SELECT id, name FROM boxes")
             existing_boxes = {
-                name.lower(): box_id for box_id, name in self.cursor.fetchall()
+                name.casefold(): box_id for box_id, name in self.cursor
             }
+        except Exception as e:
+            self.on_csv_import_failed(str(e))
+            return
 
-            with open(file_path, "r", newline="", encoding="utf-8") as csvfile:
-                reader = csv.DictReader(csvfile)
-
-                # Validate header
-                required_headers = ["Item Name", "Box", "Quantity"]
-                if not all(header in reader.fieldnames for header in required_headers):
-                    QMessageBox.critical(
-                        self,
-                        "Invalid CSV Format",
-                        f"CSV must contain headers: {', '.join(required_headers)}\n"
-                        f"Found headers: {', '.join(reader.fieldnames)}",
-                    )
-                    return
-
-                for row_num, row in enumerate(
-                    reader, start=2
-                ):  # Start at 2 (1 for header)
-                    item_name = row.get("Item Name", "").strip()
-                    box_name = row.get("Box", "").strip()
-                    quantity_str = row.get("Quantity", "").strip()
-
-                    item_error = False
-
-                    # Validate item name
-                    if not item_name:
-                        validation_errors.append(f"Row {row_num}: Item name is empty")
-                        item_error = True
-
-                    # Validate box
-                    if not box_name:
-                        validation_errors.append(f"Row {row_num}: Box name is empty")
-                        item_error = True
-                    elif box_name.lower() not in existing_boxes:
-                        validation_errors.append(
-                            f"Row {row_num}: Box '{box_name}' does not exist. Create it first."
-                        )
-                        item_error = True
-
-                    # Validate quantity
-                    try:
-                        quantity = int(quantity_str)
-                        if quantity < 1:
-                            validation_errors.append(
-                                f"Row {row_num}: Quantity must be at least 1"
-                            )
-                            item_error = True
-                    except ValueError:
-                        validation_errors.append(
-                            f"Row {row_num}: Invalid quantity '{quantity_str}' (must be a number)"
-                        )
-                        item_error = True
-                        quantity = 0
+        # Parse and validate on a pool thread; results come back via signals
+        self._import_progress = QProgressDialog("Reading CSV file...", None, 0, 100, self)
+        self._import_progress.setWindowTitle("Import from CSV")
+        # Block edits while parsing: the worker validates against existing_boxes as read now
+        self._import_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self._import_progress.setMinimumDuration(500)
+        self._import_worker = CsvImportWorker(file_path, existing_boxes)
+        self._import_worker.signals.progress.connect(self.on_csv_import_progress)
+        self._import_worker.signals.finished.connect(self.on_csv_import_parsed)
+        self._import_worker.signals.invalid_format.connect(self.on_csv_import_invalid)
+        self._import_worker.signals.failed.connect(self.on_csv_import_failed)
+        QThreadPool.globalInstance().start(self._import_worker)
+
+    def finish_csv_import_worker(self):
+        """Drop the finished import worker and close its progress dialog."""
+        self._import_worker = None
+        if self._import_progress is not None:
+            self._import_progress.close()
+            self._import_progress = None
+
+    def on_csv_import_progress(self, percent):
+        """Advance the import progress dialog to the share of the file parsed."""
+        if self._import_progress is not None:
+            self._import_progress.setValue(percent)
+
+    def on_csv_import_invalid(self, message):
+        """Report a CSV file without the required headers."""
+        self.finish_csv_import_worker()
+        QMessageBox.critical(self, "Invalid CSV Format", message)
+
+    def on_csv_import_failed(self, error):
+        """Report a CSV file that could not be read."""
+        self.finish_csv_import_worker()
+        QMessageBox.critical(
+            self, "Import Failed", f"Failed to import CSV:\n{error}"
+        )
+        self.logger.error(f"CSV import failed: {error}")
 
-                    # Add to import data
-                    import_data.append(
-                        {
-                            "row": row_num,
-                            "name": item_name,
-                            "box_name": box_name,
-                            "box_id": existing_boxes.get(box_name.lower()),
-                            "quantity": quantity,
-                            "error": item_error,
-                        }
-                    )
+    def on_csv_import_parsed(self, import_data, validation_errors):
+        """Preview the validated rows and insert them once confirmed."""
+        self.finish_csv_import_worker()
 
+        try:
             # Show preview dialog
             if not import_data:
                 QMessageBox.warning(self, self.translator.tr('msg_no_data_csv'), self.translator.tr('msg_no_data_found'))
                 return
 
+            from .dialogs import ImportPreviewDialog
+
             preview_dialog = ImportPreviewDialog(self, import_data, validation_errors)
             if preview_dialog.exec() == QDialog.DialogCode.Accepted:
-                # User confirmed import - commit to database
-                success_count = 0
-                failed_count = 0
-
-                for item in import_data:
-                    if not item["error"]:
-                        try:
-                            self.cursor.execute(
-                                "INSERT INTO items (name, box_id, quantity) VALUES (?, ?, ?)",
-                                (item["name"], item["box_id"], item["quantity"]),
-                            )
-                            success_count += 1
-                        except sqlite3.Error as e:
-                            failed_count += 1
-                            self.logger.error(
-                                f"Failed to import item '{item['name']}': {e}"
-                            )
-
-                self.conn.commit()
+                # User confirmed import - commit to database in one transaction
+                rows = [
+                    (name, box_id, quantity)
+                    for _, name, _, box_id, quantity, error in import_data
+                    if not error
+                ]
+
+                try:
+                    self.flush_audit_log()
+                    # Commits on success, rolls back on any exception
+                    with self.conn:
+                        self.cursor.execute("BEGIN IMMEDIATE")
+                        self.cursor.executemany(
+                            "INSERT INTO items (name, box_id, quantity) VALUES (?, ?, ?)",
+                            rows,
+                        )
+                    self.data_version += 1
+                    success_count = len(rows)
+                    failed_count = 0
+                except sqlite3.Error as e:
+                    success_count = 0
+                    failed_count = len(rows)
+                    self.logger.error(f"Failed to import items, rolled back: {e}")
 
                 # Log the import
                 self.log_action(
@@ -694,19 +1186,13 @@ class InventoryApp(QMainWindow):
                     ),
                 )
 
-                # Refresh the items tab if it exists
-                for i in range(self.centralWidget().findChild(QTabWidget).count()):
-                    tab = self.centralWidget().findChild(QTabWidget).widget(i)
-                    if isinstance(tab, ItemsTab):
-                        tab.load_items()
-                        tab.load_box_filter()
-                        break
+                # Refresh the items tab (if not built yet, it loads fresh when shown)
+                if self.items_tab is not None:
+                    self.items_tab.load_items()
+                    self.items_tab.load_box_filter()
 
         except Exception as e:
-            QMessageBox.critical(
-                self, "Import Failed", f"Failed to import CSV:\n{str(e)}"
-            )
-            self.logger.error(f"CSV import failed: {e}")
+            self.on_csv_import_failed(str(e))
 
     def export_logs_to_csv(self):
         """Export audit logs to CSV file."""
@@ -721,9 +1207,33 @@ class InventoryApp(QMainWindow):
         if not file_path:
             return
 
+        # Optional date range so typical exports only touch recent pages
+        days, ok = QInputDialog.getInt(
+            self,
+            "Export Audit Logs to CSV",
+            "Export logs from the last N days (0 = all logs):",
+            0,
+            0,
+            36500,
+        )
+        if not ok:
+            return
+
+        query = """
+            SELECT timestamp, action, entity_type, entity_id,
+                   entity_name, details, old_value, new_value
+            FROM audit_logs
+        """
+        params = []
+        if days:
+            since = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d %H:%M:%S")
+            query += " WHERE timestamp >= ?"
+            params.append(since)
+        query += " ORDER BY id DESC"
+
         try:
             with open(file_path, "w", newline="", encoding="utf-8") as csvfile:
-                writer = csv.writer(csvfile)
+                writer = csv.writer(csvfile, dialect=CsvExportDialect)
 
                 # Write header
                 writer.writerow(
@@ -739,27 +1249,16 @@ class InventoryApp(QMainWindow):
                     ]
                 )
 
-                # Get all logs
-                self.cursor.execute(
-                    """
-                    SELECT timestamp, action, entity_type, entity_id,
-                           entity_name, details, old_value, new_value
-                    FROM audit_logs
-                    ORDER BY id DESC
-                    """
-                )
-
-                logs = self.cursor.fetchall()
+                # Get logs (rowid order needs no sort; the date filter uses the timestamp index)
+                self.cursor.execute(query, params)
 
-                # Write data
-                for log in logs:
-                    writer.writerow(log)
+                log_count = self.write_cursor_rows(writer)
 
             # Log the export (but don't create infinite loop)
             self.log_action(
                 action="EXPORT",
                 entity_type="LOGS",
-                details=f"Exported {len(logs)} audit logs to CSV",
+                details=f"Exported {log_count} audit logs to CSV",
             )
 
             QMessageBox.information(
@@ -795,47 +1294,11 @@ class InventoryApp(QMainWindow):
             self.cursor.execute("SELECT name FROM boxes ORDER BY name LIMIT 3")
             boxes = self.cursor.fetchall()
 
-            with open(file_path, "w", newline="", encoding="utf-8") as csvfile:
-                writer = csv.writer(csvfile)
-
-                # Write header
-                writer.writerow(["Item Name", "Box", "Quantity"])
-                self.logger.info("CSV template header written")
-
-                # Write example rows
-                if boxes:
-                    # Use real box names as examples
-                    writer.writerow(["Example Item 1", boxes[0][0], "5"])
-                    if len(boxes) > 1:
-                        writer.writerow(["Example Item 2", boxes[1][0], "10"])
-                    if len(boxes) > 2:
-                        writer.writerow(["Example Item 3", boxes[2][0], "3"])
-                else:
-                    # No boxes exist, use placeholder examples
-                    writer.writerow(["Example Item 1", "Box Name Here", "5"])
-                    writer.writerow(["Example Item 2", "Box Name Here", "10"])
-                    writer.writerow(["Example Item 3", "Box Name Here", "3"])
-
-                # Write instructions as comments (Excel/LibreOffice will show these)
-                writer.writerow([])
-                writer.writerow(["# INSTRUCTIONS:"])
-                writer.writerow(["# 1. Replace example rows with your actual items"])
-                writer.writerow(["# 2. Item Name: Name of the item (required)"])
-                writer.writerow(
-                    ["# 3. Box: Must match an existing box name exactly (required)"]
-                )
-                writer.writerow(
-                    ["# 4. Quantity: Number of items, must be 1 or higher (required)"]
-                )
-                writer.writerow(["# 5. Delete these instruction rows before importing"])
-                writer.writerow(
-                    ["# 6. Use File -> Import from CSV to import this file"]
-                )
-
-                if not boxes:
-                    writer.writerow([])
-                    writer.writerow(["# WARNING: No boxes found in database!"])
-                    writer.writerow(["# Create boxes first before importing items."])
+            # Stream the template lines through one large buffered handle
+            with open(
+                file_path, "w", buffering=1 << 20, newline="", encoding="utf-8"
+            ) as csvfile:
+                csvfile.writelines(iter_template_rows(boxes))
 
             self.logger.info("Template file created successfully")
 
@@ -873,54 +1336,37 @@ class InventoryApp(QMainWindow):
     def show_help(self):
         """Show comprehensive help dialog."""
         self.logger.info("Opening help dialog")
+        from .dialogs import HelpDialog
+
         help_dialog = HelpDialog(self)
         help_dialog.exec()
         self.logger.info("Help dialog closed")
 
     def show_about(self):
         """Show about dialog."""
-        about_text = f"""
-        <h2>{__app_name__}</h2>
-        <p><b>Version:</b> {__version__}</p>
-        <p><b>Developer:</b> {__developer__}</p>
-        <p>A modern inventory management system with comprehensive logging and audit trails.</p>
-
-        <h3>Features:</h3>
-        <ul>
-            <li>✓ Manage items and storage boxes</li>
-            <li>✓ Search and filter capabilities</li>
-            <li>✓ CSV import/export functionality</li>
-            <li>✓ Complete audit log and transaction history</li>
-            <li>✓ Automatic database backups</li>
-            <li>✓ Dark & Light theme support</li>
-            <li>✓ Keyboard shortcuts for power users</li>
-        </ul>
+        QMessageBox.about(self, self.ABOUT_TITLE, self.ABOUT_HTML)
 
-        <p><b>Database:</b> SQLite</p>
-        <p><b>Framework:</b> PyQt6</p>
-        <p><b>Press F1 for detailed help</b></p>
-        """
-
-        QMessageBox.about(self, f"About {__app_name__}", about_text)
+    def load_settings_cache(self):
+        """Load all settings into memory once; later reads skip SQLite."""
+        if self._settings_cache is None:
+            try:
+                self.cursor.execute("SELECT key, value FROM settings")
+                self._settings_cache = dict(self.cursor.fetchall())
+                self.logger.info(f"Loaded {len(self._settings_cache)} settings")
+            except sqlite3.OperationalError:
+                self.logger.info("Settings table not found, using defaults")
+                self._settings_cache = {}
+        return self._settings_cache
 
     def get_current_language(self):
         """Get the current language preference."""
-        try:
-            self.cursor.execute("SELECT value FROM settings WHERE key = 'language'")
-            result = self.cursor.fetchone()
-            lang = result[0] if result else "en"
-            self.logger.info(f"Retrieved language preference from database: {lang}")
-            return lang
-        except sqlite3.OperationalError:
-            self.logger.info("Settings table not found, defaulting to English")
-            return "en"
+        lang = self.load_settings_cache().get("language", "en")
+        self.logger.info(f"Retrieved language preference: {lang}")
+        return lang
 
     def load_language_preference(self):
         """Load saved language preference."""
         self.logger.info("Loading language preference...")
-        from modules import get_translator
-
-        self.translator = get_translator()
         lang = self.get_current_language()
         success = self.translator.set_language(lang)
         if success:
@@ -930,53 +1376,42 @@ class InventoryApp(QMainWindow):
         else:
             self.logger.warning(f"Failed to set language to: {lang}, using default")
 
-    def save_language_preference(self, language):
-        """Save language preference to database."""
-        self.logger.info(f"Saving language preference: {language}")
+    def set_setting(self, key, value, commit=True):
+        """Save a setting to the database and the in-memory cache."""
+        self.logger.info(f"Saving setting: {key} = {value}")
         try:
             self.cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS settings (
-                    key TEXT PRIMARY KEY,
-                    value TEXT
-                )
-            """
+                "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+                (key, value),
             )
-            self.cursor.execute(
-                """
-                INSERT OR REPLACE INTO settings (key, value) VALUES ('language', ?)
-            """,
-                (language,),
-            )
-            self.conn.commit()
-            self.logger.info(f"Language preference saved successfully: {language}")
+            if commit:
+                self.conn.commit()
+            self.load_settings_cache()[key] = value
         except sqlite3.Error as e:
-            self.logger.error(f"Failed to save language preference: {e}")
+            self.logger.error(f"Failed to save setting '{key}': {e}")
 
     def change_language(self, language_code):
         """Change the application language."""
         self.logger.info(f"User requested language change to: {language_code}")
-        from modules import get_translator
-
-        translator = get_translator()
 
-        if translator.set_language(language_code):
-            self.save_language_preference(language_code)
+        if self.translator.set_language(language_code):
+            # Setting and audit row share one commit
+            with self.transaction():
+                self.set_setting("language", language_code, commit=False)
+                self.log_action(
+                    action="LANGUAGE_CHANGE",
+                    entity_type="SETTINGS",
+                    details=f"Language changed to {language_code}",
+                )
 
             self.logger.info(f"Showing language change confirmation dialog")
             QMessageBox.information(
                 self,
                 "Language Changed",
-                "Language has been changed. Please restart the application for changes to take effect.",
+                self.LANGUAGE_CHANGED_MSG,
             )
             self.logger.info("Language change dialog closed")
 
-            self.log_action(
-                action="LANGUAGE_CHANGE",
-                entity_type="SETTINGS",
-                details=f"Language changed to {language_code}",
-            )
-
     def setup_shortcuts(self):
         """Setup keyboard shortcuts."""
         # Ctrl+F - Focus search in current tab
@@ -996,20 +1431,18 @@ class InventoryApp(QMainWindow):
         export_shortcut.activated.connect(self.export_to_csv)
 
         # Ctrl+1, Ctrl+2, Ctrl+3, Ctrl+4 - Switch tabs
-        tab1_shortcut = QShortcut(QKeySequence("Ctrl+1"), self)
-        tab1_shortcut.activated.connect(lambda: self.tabs.setCurrentIndex(0))
-
-        tab2_shortcut = QShortcut(QKeySequence("Ctrl+2"), self)
-        tab2_shortcut.activated.connect(lambda: self.tabs.setCurrentIndex(1))
-
-        tab3_shortcut = QShortcut(QKeySequence("Ctrl+3"), self)
-        tab3_shortcut.activated.connect(lambda: self.tabs.setCurrentIndex(2))
-
-        tab4_shortcut = QShortcut(QKeySequence("Ctrl+4"), self)
-        tab4_shortcut.activated.connect(lambda: self.tabs.setCurrentIndex(3))
+        self.tab_shortcuts = []
+        for index, key in enumerate(("Ctrl+1", "Ctrl+2", "Ctrl+3", "Ctrl+4")):
+            tab_shortcut = QShortcut(QKeySequence(key), self)
+            tab_shortcut.activated.connect(partial(self.goto_tab, index))
+            self.tab_shortcuts.append(tab_shortcut)
 
         self.logger.info("Keyboard shortcuts configured")
 
+    def goto_tab(self, index):
+        """Switch to the tab at the given index."""
+        self.tabs.setCurrentIndex(index)
+
     def focus_search(self):
         """Focus the search box in the current tab."""
         current_tab = self.tabs.currentWidget()
@@ -1037,8 +1470,7 @@ class InventoryApp(QMainWindow):
         current_theme = ModernStyle.current_theme
         new_theme = "light" if current_theme == "dark" else "dark"
 
-        ModernStyle.set_theme(new_theme)
-        self.setStyleSheet(ModernStyle.get_stylesheet())
+        ModernStyle.apply_theme(self, new_theme)
 
         # Update theme action text
         if new_theme == "dark":
@@ -1046,79 +1478,67 @@ class InventoryApp(QMainWindow):
         else:
             self.theme_action.setText("Switch to Dark Theme")
 
-        # Save preference
-        self.save_theme_preference(new_theme)
-
+        # Save preference and audit row in one transaction
         self.logger.info(f"Theme switched to: {new_theme}")
-        self.log_action(
-            action="THEME_CHANGE",
-            entity_type="SETTINGS",
-            details=f"Theme changed to {new_theme}",
-        )
+        with self.transaction():
+            self.set_setting("theme", new_theme, commit=False)
+            self.log_action(
+                action="THEME_CHANGE",
+                entity_type="SETTINGS",
+                details=f"Theme changed to {new_theme}",
+            )
 
         # Inform user
         QMessageBox.information(
             self,
             "Theme Changed",
-            f"Theme changed to {new_theme.capitalize()} mode.\nSome elements may require a restart to fully update.",
+            self.THEME_CHANGED_MSG.format(theme=new_theme.capitalize()),
         )
 
-    def save_theme_preference(self, theme):
-        """Save theme preference to database."""
-        try:
-            self.cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS settings (
-                    key TEXT PRIMARY KEY,
-                    value TEXT
-                )
-            """
-            )
-            self.cursor.execute(
-                """
-                INSERT OR REPLACE INTO settings (key, value) VALUES ('theme', ?)
-            """,
-                (theme,),
-            )
-            self.conn.commit()
-            self.logger.info(f"Theme preference saved: {theme}")
-        except sqlite3.Error as e:
-            self.logger.error(f"Failed to save theme preference: {e}")
-
     def load_theme_preference_initial(self):
         """Load saved theme preference at startup (before UI is created)."""
-        try:
-            self.cursor.execute("SELECT value FROM settings WHERE key = 'theme'")
-            result = self.cursor.fetchone()
-            if result:
-                theme = result[0]
-                ModernStyle.set_theme(theme)
-                self.logger.info(f"Loaded theme preference: {theme}")
-        except sqlite3.OperationalError:
+        theme = self.load_settings_cache().get("theme")
+        if theme:
+            ModernStyle.set_theme(theme)
+            self.logger.info(f"Loaded theme preference: {theme}")
+        else:
             self.logger.info("No theme preference found, using default")
 
     def load_theme_preference(self):
         """Load saved theme preference and update UI."""
-        try:
-            self.cursor.execute("SELECT value FROM settings WHERE key = 'theme'")
-            result = self.cursor.fetchone()
-            if result:
-                theme = result[0]
-                ModernStyle.set_theme(theme)
-                if hasattr(self, "theme_action"):
-                    if theme == "light":
-                        self.theme_action.setText("Switch to Dark Theme")
-                    else:
-                        self.theme_action.setText("Switch to Light Theme")
-                self.logger.info(f"Loaded theme preference: {theme}")
-        except sqlite3.OperationalError:
+        theme = self.load_settings_cache().get("theme")
+        if theme:
+            ModernStyle.set_theme(theme)
+            if hasattr(self, "theme_action"):
+                if theme == "light":
+                    self.theme_action.setText("Switch to Dark Theme")
+                else:
+                    self.theme_action.setText("Switch to Light Theme")
+            self.logger.info(f"Loaded theme preference: {theme}")
+        else:
             self.logger.info("No theme preference found, using default")
 
     def closeEvent(self, event):
         """Handle window close event."""
         self.logger.info("Application closing")
+
+        # Results of in-flight workers must not reach slots that use the connection
+        if self._backup_worker is not None:
+            self._backup_worker.signals.finished.disconnect()
+            self._backup_worker.signals.failed.disconnect()
+        if self._import_worker is not None:
+            self._import_worker.signals.progress.disconnect()
+            self._import_worker.signals.finished.disconnect()
+            self._import_worker.signals.invalid_format.disconnect()
+            self._import_worker.signals.failed.disconnect()
+        # Worker readers would keep the TRUNCATE checkpoint below from completing
+        QThreadPool.globalInstance().waitForDone()
+
         self.log_action(
             action="SHUTDOWN", entity_type="APPLICATION", details="Application closed"
         )
+        self.flush_audit_log()
+        self.optimize_database()
+        self.checkpoint_wal("TRUNCATE")
         self.conn.close()
         event.accept()
@@ -0,0 +1,102 @@
+"""
+Item delegates shared by the table tabs
+"""
+
+from PyQt6.QtWidgets import QStyle, QStyledItemDelegate
+from PyQt6.QtCore import Qt, QEvent, QRect, pyqtSignal
+from PyQt6.QtGui import QColor, QPainter
+
+from .styles import ModernStyle
+
+
+class RowActionsDelegate(QStyledItemDelegate):
+    """Paints Edit/Delete buttons in a cell instead of embedding widgets.
+
+    Clicks are reported by row through edit_requested / delete_requested.
+    The view must have mouse tracking enabled for hover highlighting.
+    """
+
+    edit_requested = pyqtSignal(int)
+    delete_requested = pyqtSignal(int)
+
+    BUTTON_WIDTH = 45
+    BUTTON_HEIGHT = 22
+    BUTTON_SPACING = 5
+    BUTTON_RADIUS = 4
+    FONT_PIXEL_SIZE = 11
+
+    EDIT = 0
+    DELETE = 1
+
+    def __init__(self, edit_label, delete_label, parent=None):
+        super().__init__(parent)
+        self.labels = (edit_label, delete_label)
+        # (row, button) currently under the mouse
+        self.hovered = None
+
+    def button_rects(self, cell):
+        """Return the Edit and Delete button rectangles centred in a cell."""
+        total = 2 * self.BUTTON_WIDTH + self.BUTTON_SPACING
+        left = cell.x() + (cell.width() - total) // 2
+        top = cell.y() + (cell.height() - self.BUTTON_HEIGHT) // 2
+        edit_rect = QRect(left, top, self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
+        delete_rect = edit_rect.translated(self.BUTTON_WIDTH + self.BUTTON_SPACING, 0)
+        return edit_rect, delete_rect
+
+    def button_at(self, cell, pos):
+        """Return EDIT, DELETE or None for a point inside a cell."""
+        for button, rect in enumerate(self.button_rects(cell)):
+            if rect.contains(pos):
+                return button
+        return None
+
+    def paint(self, painter, option, index):
+        # Background, selection and alternating colours as for any other cell
+        super().paint(painter, option, index)
+
+        colors = (
+            (ModernStyle.PRIMARY, "#2da35f"),
+            (ModernStyle.DANGER, "#d63d3d"),
+        )
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        font = painter.font()
+        font.setPixelSize(self.FONT_PIXEL_SIZE)
+        painter.setFont(font)
+
+        # Only the cell under the mouse can show a hovered button
+        cell_hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        for button, rect in enumerate(self.button_rects(option.rect)):
+            base, hover = colors[button]
+            is_hovered = cell_hovered and self.hovered == (index.row(), button)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(hover if is_hovered else base))
+            painter.drawRoundedRect(rect, self.BUTTON_RADIUS, self.BUTTON_RADIUS)
+            painter.setPen(QColor(ModernStyle.TEXT))
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, self.labels[button])
+
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        event_type = event.type()
+        if event_type == QEvent.Type.MouseMove:
+            button = self.button_at(option.rect, event.position().toPoint())
+            hovered = (index.row(), button) if button is not None else None
+            if hovered != self.hovered:
+                self.hovered = hovered
+                self.parent().viewport().update()
+            return False
+
+        if (
+            event_type == QEvent.Type.MouseButtonRelease
+            and event.button() == Qt.MouseButton.LeftButton
+        ):
+            button = self.button_at(option.rect, event.position().toPoint())
+            if button == self.EDIT:
+                self.edit_requested.emit(index.row())
+                return True
+            if button == self.DELETE:
+                self.delete_requested.emit(index.row())
+                return True
+
+        return False
@@ -2,7 +2,9 @@
 Dialog windows for the application
 """
 
+import os
 import logging
+import markdown2
 from PyQt6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -14,25 +16,71 @@ from PyQt6.QtWidgets import (
     QComboBox,
     QSpinBox,
     QMessageBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QAbstractItemView,
     QTextEdit,
     QWidget,
-    QTabWidget,
     QScrollArea,
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont, QColor
+from PyQt6.QtCore import Qt, QTimer, QAbstractTableModel, QModelIndex, QSignalBlocker
+from PyQt6.QtGui import QColor, QBrush
 
-from .styles import ModernStyle
+from .styles import ModernStyle, bold_font
 from . import get_translator
 
 
+def make_title(text):
+    """Return a dialog title label."""
+    title = QLabel(text)
+    title.setFont(bold_font(16))
+    return title
+
+
+def make_separator():
+    """Return a horizontal separator, styled by the app stylesheet."""
+    separator = QWidget()
+    separator.setFixedHeight(2)
+    separator.setProperty("class", "separator")
+    return separator
+
+
+def report_first_failure(dialog, log_prefix, checks):
+    """Warn about the first failing (failed, log reason, message key) check.
+
+    Returns True if a check failed.
+    """
+    for failed, reason, message_key in checks:
+        if failed:
+            dialog.logger.warning(f"{log_prefix}: {reason}")
+            QMessageBox.warning(
+                dialog,
+                dialog.translator.tr("msg_error"),
+                dialog.translator.tr(message_key),
+            )
+            return True
+    return False
+
+
+def make_button_row(dialog, primary_btn):
+    """Return the standard Cancel + primary action button row for a dialog."""
+    button_layout = QHBoxLayout()
+
+    cancel_btn = QPushButton(get_translator().tr("btn_cancel"))
+    cancel_btn.setProperty("class", "danger")
+    cancel_btn.clicked.connect(dialog.reject)
+    button_layout.addWidget(cancel_btn)
+    button_layout.addWidget(primary_btn)
+
+    return button_layout
+
+
 class EditItemDialog(QDialog):
     """Dialog for editing an item."""
 
+    # Longest name/location accepted, enforced while typing
+    MAX_TEXT_LENGTH = 255
+
     def __init__(self, parent, cursor, item_data=None):
         super().__init__(parent)
         self.logger = logging.getLogger(__name__)
@@ -54,133 +102,100 @@ class EditItemDialog(QDialog):
         self.setup_ui()
 
     def setup_ui(self):
+        data = self.item_data
         layout = QVBoxLayout()
 
         # Title
-        title = QLabel("Edit Item" if self.item_data else "Add New Item")
-        title.setFont(QFont("Arial", 16, QFont.Weight.Bold))
-        layout.addWidget(title)
+        layout.addWidget(make_title("Edit Item" if data else "Add New Item"))
 
         # Form
         form_layout = QFormLayout()
 
         # Item name
         self.name_input = QLineEdit()
+        self.name_input.setMaxLength(self.MAX_TEXT_LENGTH)
         self.name_input.setPlaceholderText(self.translator.tr("placeholder_item_name"))
-        if self.item_data:
-            self.name_input.setText(self.item_data[1])
+        if data:
+            self.name_input.setText(data[1])
         form_layout.addRow("Item Name:", self.name_input)
 
         # Box selection
         self.box_combo = QComboBox()
         self.load_boxes()
-        if self.item_data and self.item_data[4]:
-            # Find and select current box
-            for i in range(self.box_combo.count()):
-                if self.box_combo.itemData(i) == self.item_data[4]:
-                    self.box_combo.setCurrentIndex(i)
-                    break
         form_layout.addRow("Box:", self.box_combo)
 
         # Quantity
         self.quantity_spin = QSpinBox()
         self.quantity_spin.setMinimum(1)
         self.quantity_spin.setMaximum(99999)
-        if self.item_data:
-            self.quantity_spin.setValue(self.item_data[3])
+        if data:
+            self.quantity_spin.setValue(data[3])
         else:
             self.quantity_spin.setValue(1)
         form_layout.addRow("Quantity:", self.quantity_spin)
 
         layout.addLayout(form_layout)
 
-        # Separator
-        separator = QWidget()
-        separator.setFixedHeight(2)
-        separator.setStyleSheet(f"background-color: {ModernStyle.BORDER};")
-        layout.addWidget(separator)
+        layout.addWidget(make_separator())
 
         # Buttons
-        button_layout = QHBoxLayout()
-
-        cancel_btn = QPushButton(self.translator.tr("btn_cancel"))
-        cancel_btn.setProperty("class", "danger")
-        cancel_btn.clicked.connect(self.reject)
-        button_layout.addWidget(cancel_btn)
-
         save_btn = QPushButton(
             self.translator.tr("btn_update")
-            if self.item_data
+            if data
             else self.translator.tr("btn_add")
         )
         save_btn.clicked.connect(self.save)
-        button_layout.addWidget(save_btn)
-
-        layout.addLayout(button_layout)
+        layout.addLayout(make_button_row(self, save_btn))
 
         self.setLayout(layout)
 
     def load_boxes(self):
-        """Load boxes into combobox."""
-        self.cursor.execute("SELECT id, name FROM boxes ORDER BY name")
-        boxes = self.cursor.fetchall()
-
-        # Get the last added box (highest ID)
-        self.cursor.execute("SELECT MAX(id) FROM boxes")
-        last_box_id = self.cursor.fetchone()[0]
-
-        for box_id, name in boxes:
-            self.box_combo.addItem(f"{box_id} - {name}", box_id)
+        """Load boxes into combobox and select the current (or newest) box."""
+        # is_newest flags the last added box (highest ID), the default for new items
+        self.cursor.execute(
+            """
+            SELECT id, name, id = (SELECT MAX(id) FROM boxes) AS is_newest
+            FROM boxes ORDER BY name
+            """
+        )
+        box_ids = []
+        labels = []
+        newest_index = -1
+        for i, (box_id, name, is_newest) in enumerate(self.cursor):
+            box_ids.append(box_id)
+            labels.append(f"{box_id} - {name}")
+            if is_newest:
+                newest_index = i
+
+        # Populate in one batch, then attach the ids
+        with QSignalBlocker(self.box_combo):
+            self.box_combo.addItems(labels)
+            for i, box_id in enumerate(box_ids):
+                self.box_combo.setItemData(i, box_id)
+
+        # Edit: select the item's box; add: default to the newest box
+        if self.item_data:
+            target = self.item_data[4]
+            target_index = self.box_combo.findData(target) if target else -1
+        else:
+            target_index = newest_index
 
-        # Set default to last added box if adding new item
-        if not self.item_data and last_box_id:
-            for i in range(self.box_combo.count()):
-                if self.box_combo.itemData(i) == last_box_id:
-                    self.box_combo.setCurrentIndex(i)
-                    break
+        if target_index >= 0:
+            self.box_combo.setCurrentIndex(target_index)
 
     def save(self):
         """Save the item."""
         name = self.name_input.text().strip()
-        if not name:
-            self.logger.warning("Item save cancelled: name is empty")
-            QMessageBox.warning(
-                self,
-                self.translator.tr("msg_error"),
-                self.translator.tr("msg_item_name_empty"),
-            )
-            return
-
         box_id = self.box_combo.currentData()
-        if not box_id:
-            self.logger.warning("Item save cancelled: no box selected")
-            QMessageBox.warning(
-                self,
-                self.translator.tr("msg_error"),
-                self.translator.tr("msg_select_box"),
-            )
-            return
-
         quantity = self.quantity_spin.value()
-        if quantity < 1:
-            self.logger.warning(f"Item save cancelled: invalid quantity {quantity}")
-            QMessageBox.warning(
-                self,
-                self.translator.tr("msg_error"),
-                self.translator.tr("msg_quantity_min"),
-            )
-            return
 
-        # Validate name length
-        if len(name) > 255:
-            self.logger.warning(
-                f"Item save cancelled: name too long ({len(name)} characters)"
-            )
-            QMessageBox.warning(
-                self,
-                self.translator.tr("msg_error"),
-                self.translator.tr("msg_item_name_too_long"),
-            )
+        # Name length is capped by the input's maxLength
+        checks = (
+            (not name, "name is empty", "msg_item_name_empty"),
+            (not box_id, "no box selected", "msg_select_box"),
+            (quantity < 1, f"invalid quantity {quantity}", "msg_quantity_min"),
+        )
+        if report_first_failure(self, "Item save cancelled", checks):
             return
 
         self.logger.info(
@@ -191,8 +206,72 @@ class EditItemDialog(QDialog):
         self.logger.info("Item dialog closed (accepted)")
 
 
+class ImportPreviewModel(QAbstractTableModel):
+    """Read-only table model over CSV import preview rows."""
+
+    # Preview column -> index into an import_data tuple
+    COLUMNS = (0, 1, 2, 4)
+    ERROR_FIELD = 5
+    # Columns holding ints that need converting for display
+    NUMERIC_COLUMNS = (True, False, False, True)
+
+    CENTER = Qt.AlignmentFlag.AlignCenter
+    LEFT = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+    ALIGNMENTS = (CENTER, LEFT, LEFT, CENTER)
+
+    # Roles resolved once; data() runs for every visible cell and role
+    DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+    ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+    FOREGROUND_ROLE = Qt.ItemDataRole.ForegroundRole
+
+    def __init__(self, rows, headers, parent=None):
+        super().__init__(parent)
+        self.rows = rows
+        self.headers = headers
+        self.danger_brush = QBrush(QColor(ModernStyle.DANGER))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        column = index.column()
+        if role == self.DISPLAY_ROLE:
+            value = self.rows[index.row()][self.COLUMNS[column]]
+            return str(value) if self.NUMERIC_COLUMNS[column] else value
+        if role == self.ALIGNMENT_ROLE:
+            return self.ALIGNMENTS[column]
+        if role == self.FOREGROUND_ROLE:
+            # Invalid rows are highlighted everywhere except the row number
+            if column and self.rows[index.row()][self.ERROR_FIELD]:
+                return self.danger_brush
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+
 class ImportPreviewDialog(QDialog):
-    """Dialog for previewing CSV import data before committing."""
+    """Dialog for previewing CSV import data before committing.
+
+    import_data rows are (row, name, box_name, box_id, quantity, error) tuples.
+    """
+
+    # Only the head of the file is shown; the full data is still imported
+    PREVIEW_ROW_LIMIT = 100
+
+    # Validation errors listed in the details box; the rest are summarised
+    ERROR_DISPLAY_LIMIT = 500
 
     def __init__(self, parent, import_data, validation_errors):
         super().__init__(parent)
@@ -214,53 +293,61 @@ class ImportPreviewDialog(QDialog):
         layout = QVBoxLayout()
 
         # Title
-        title = QLabel("Import Preview")
-        title.setFont(QFont("Arial", 16, QFont.Weight.Bold))
-        layout.addWidget(title)
+        layout.addWidget(make_title("Import Preview"))
 
         # Summary
-        summary = QLabel(
-            f"Found {len(self.import_data)} items to import. "
-            f"{'⚠️ ' + str(len(self.validation_errors)) + ' validation errors found!' if self.validation_errors else '✓ All validations passed!'}"
-        )
-        summary.setStyleSheet(
-            f"color: {ModernStyle.DANGER if self.validation_errors else ModernStyle.PRIMARY}; "
-            "font-size: 14px; font-weight: bold; padding: 10px;"
-        )
+        error_count = len(self.validation_errors)
+        if error_count:
+            status, style_class = f"⚠️ {error_count} validation errors found!", "summary_error"
+        else:
+            status, style_class = "✓ All validations passed!", "summary_ok"
+        summary = QLabel(f"Found {len(self.import_data)} items to import. {status}")
+        summary.setProperty("class", style_class)
         layout.addWidget(summary)
 
         # Validation errors section
         if self.validation_errors:
             error_label = QLabel("Validation Errors:")
-            error_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-            error_label.setStyleSheet(f"color: {ModernStyle.DANGER};")
+            error_label.setFont(bold_font(12))
+            error_label.setObjectName("errorLabel")
             layout.addWidget(error_label)
 
-            error_text = QTextEdit()
-            error_text.setReadOnly(True)
-            error_text.setMaximumHeight(150)
-            error_text.setPlainText("\n".join(self.validation_errors))
-            error_text.setStyleSheet(
-                f"background-color: {ModernStyle.SURFACE}; color: {ModernStyle.DANGER};"
+            # The error list is only built when the user asks to see it
+            self.error_text = None
+            self.error_toggle_btn = QPushButton(
+                f"Show {len(self.validation_errors)} errors"
             )
-            layout.addWidget(error_text)
+            self.error_toggle_btn.setProperty("class", "neutral")
+            self.error_toggle_btn.clicked.connect(self.toggle_error_details)
+            layout.addWidget(self.error_toggle_btn)
+            self.error_layout = QVBoxLayout()
+            layout.addLayout(self.error_layout)
 
         # Preview table
-        preview_label = QLabel("Preview Data:")
-        preview_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        preview_rows = self.import_data[: self.PREVIEW_ROW_LIMIT]
+        if len(preview_rows) < len(self.import_data):
+            preview_label = QLabel(
+                f"Preview Data (showing first {len(preview_rows)} of {len(self.import_data)} items):"
+            )
+        else:
+            preview_label = QLabel("Preview Data:")
+        preview_label.setFont(bold_font(12))
         layout.addWidget(preview_label)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(
-            [
-                self.translator.tr("header_row"),
-                self.translator.tr("header_item_name"),
-                self.translator.tr("header_box_name"),
-                self.translator.tr("header_quantity"),
-            ]
+        # Model-backed view: cells are rendered from import_data on demand
+        self.table = QTableView()
+        self.table.setModel(
+            ImportPreviewModel(
+                preview_rows,
+                [
+                    self.translator.tr("header_row"),
+                    self.translator.tr("header_item_name"),
+                    self.translator.tr("header_box_name"),
+                    self.translator.tr("header_quantity"),
+                ],
+                self.table,
+            )
         )
-        self.table.setRowCount(len(self.import_data))
 
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
@@ -271,74 +358,59 @@ class ImportPreviewDialog(QDialog):
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
 
-        for idx, item in enumerate(self.import_data):
-            # Row number
-            row_item = QTableWidgetItem(str(item.get("row", idx + 1)))
-            row_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(idx, 0, row_item)
-
-            # Item name
-            name_item = QTableWidgetItem(item.get("name", ""))
-            name_item.setTextAlignment(
-                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
-            )
-            if item.get("error"):
-                name_item.setForeground(QColor(ModernStyle.DANGER))
-            self.table.setItem(idx, 1, name_item)
-
-            # Box name
-            box_item = QTableWidgetItem(item.get("box_name", ""))
-            box_item.setTextAlignment(
-                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
-            )
-            if item.get("error"):
-                box_item.setForeground(QColor(ModernStyle.DANGER))
-            self.table.setItem(idx, 2, box_item)
-
-            # Quantity
-            qty_item = QTableWidgetItem(str(item.get("quantity", "")))
-            qty_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            if item.get("error"):
-                qty_item.setForeground(QColor(ModernStyle.DANGER))
-            self.table.setItem(idx, 3, qty_item)
+        # Uniform row heights: the view never asks the model for per-row sizes
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
 
         layout.addWidget(self.table)
 
-        # Separator
-        separator = QWidget()
-        separator.setFixedHeight(2)
-        separator.setStyleSheet(f"background-color: {ModernStyle.BORDER};")
-        layout.addWidget(separator)
+        layout.addWidget(make_separator())
 
-        # Buttons
-        button_layout = QHBoxLayout()
-
-        cancel_btn = QPushButton(self.translator.tr("btn_cancel"))
-        cancel_btn.setProperty("class", "danger")
-        cancel_btn.clicked.connect(self.reject)
-        button_layout.addWidget(cancel_btn)
-
-        # Only allow import if no errors
+        # Buttons; only allow import if no errors
         if not self.validation_errors:
-            import_btn = QPushButton(
+            primary_btn = QPushButton(
                 f"{self.translator.tr('btn_import')} {len(self.import_data)} {self.translator.tr('tab_items')}"
             )
-            import_btn.clicked.connect(self.accept)
-            button_layout.addWidget(import_btn)
+            primary_btn.clicked.connect(self.accept)
         else:
-            error_btn = QPushButton(self.translator.tr("btn_fix_errors"))
-            error_btn.setEnabled(False)
-            error_btn.setProperty("class", "neutral")
-            button_layout.addWidget(error_btn)
-
-        layout.addLayout(button_layout)
+            primary_btn = QPushButton(self.translator.tr("btn_fix_errors"))
+            primary_btn.setEnabled(False)
+            primary_btn.setProperty("class", "neutral")
+        layout.addLayout(make_button_row(self, primary_btn))
 
         self.setLayout(layout)
 
 
+    def toggle_error_details(self):
+        """Show or hide the validation error list, building it on first use."""
+        count = len(self.validation_errors)
+        if self.error_text is None:
+            shown = self.validation_errors[: self.ERROR_DISPLAY_LIMIT]
+            text = "\n".join(shown)
+            if count > len(shown):
+                text += f"\n…and {count - len(shown)} more"
+
+            self.error_text = QTextEdit()
+            self.error_text.setObjectName("errorText")
+            self.error_text.setReadOnly(True)
+            self.error_text.setMaximumHeight(150)
+            self.error_text.setPlainText(text)
+            self.error_layout.addWidget(self.error_text)
+            visible = True
+        else:
+            visible = not self.error_text.isVisible()
+            self.error_text.setVisible(visible)
+
+        self.error_toggle_btn.setText(
+            f"Hide {count} errors" if visible else f"Show {count} errors"
+        )
+
+
 class EditBoxDialog(QDialog):
     """Dialog for editing a box."""
 
+    # Longest name/location accepted, enforced while typing
+    MAX_TEXT_LENGTH = 255
+
     def __init__(self, parent, box_data=None):
         super().__init__(parent)
         self.logger = logging.getLogger(__name__)
@@ -359,96 +431,56 @@ class EditBoxDialog(QDialog):
         self.setup_ui()
 
     def setup_ui(self):
+        data = self.box_data
         layout = QVBoxLayout()
 
         # Title
-        title = QLabel("Edit Box" if self.box_data else "Add New Box")
-        title.setFont(QFont("Arial", 16, QFont.Weight.Bold))
-        layout.addWidget(title)
+        layout.addWidget(make_title("Edit Box" if data else "Add New Box"))
 
         # Form
         form_layout = QFormLayout()
 
         # Box name
         self.name_input = QLineEdit()
+        self.name_input.setMaxLength(self.MAX_TEXT_LENGTH)
         self.name_input.setPlaceholderText(self.translator.tr("placeholder_box_name"))
-        if self.box_data:
-            self.name_input.setText(self.box_data[1])
+        if data:
+            self.name_input.setText(data[1])
         form_layout.addRow("Box Name:", self.name_input)
 
         # Location
         self.location_input = QLineEdit()
+        self.location_input.setMaxLength(self.MAX_TEXT_LENGTH)
         self.location_input.setPlaceholderText(
             self.translator.tr("placeholder_location")
         )
-        if self.box_data and len(self.box_data) > 2:
-            self.location_input.setText(self.box_data[2] or "")
+        if data and len(data) > 2:
+            self.location_input.setText(data[2] or "")
         form_layout.addRow("Location:", self.location_input)
 
         layout.addLayout(form_layout)
 
-        # Separator
-        separator = QWidget()
-        separator.setFixedHeight(2)
-        separator.setStyleSheet(f"background-color: {ModernStyle.BORDER};")
-        layout.addWidget(separator)
+        layout.addWidget(make_separator())
 
         # Buttons
-        button_layout = QHBoxLayout()
-
-        cancel_btn = QPushButton(self.translator.tr("btn_cancel"))
-        cancel_btn.setProperty("class", "danger")
-        cancel_btn.clicked.connect(self.reject)
-        button_layout.addWidget(cancel_btn)
-
         save_btn = QPushButton(
             self.translator.tr("btn_update")
-            if self.box_data
+            if data
             else self.translator.tr("btn_add")
         )
         save_btn.clicked.connect(self.save)
-        button_layout.addWidget(save_btn)
-
-        layout.addLayout(button_layout)
+        layout.addLayout(make_button_row(self, save_btn))
 
         self.setLayout(layout)
 
     def save(self):
         """Save the box."""
         name = self.name_input.text().strip()
-        if not name:
-            self.logger.warning("Box save cancelled: name is empty")
-            QMessageBox.warning(
-                self,
-                self.translator.tr("msg_error"),
-                self.translator.tr("msg_box_name_empty"),
-            )
-            return
-
-        # Validate name length
-        if len(name) > 255:
-            self.logger.warning(
-                f"Box save cancelled: name too long ({len(name)} characters)"
-            )
-            QMessageBox.warning(
-                self,
-                self.translator.tr("msg_error"),
-                self.translator.tr("msg_box_name_too_long"),
-            )
-            return
-
         location = self.location_input.text().strip()
 
-        # Validate location length
-        if location and len(location) > 255:
-            self.logger.warning(
-                f"Box save cancelled: location too long ({len(location)} characters)"
-            )
-            QMessageBox.warning(
-                self,
-                self.translator.tr("msg_error"),
-                self.translator.tr("msg_location_too_long"),
-            )
+        # Name and location lengths are capped by the inputs' maxLength
+        checks = ((not name, "name is empty", "msg_box_name_empty"),)
+        if report_first_failure(self, "Box save cancelled", checks):
             return
 
         self.logger.info(f"Box dialog saved: name='{name}', location='{location}'")
@@ -460,120 +492,144 @@ class EditBoxDialog(QDialog):
 class HelpDialog(QDialog):
     """Help dialog that displays markdown-formatted help content."""
 
+    # Markdown help files, one per language (help_<lang>.md)
+    HELP_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "help")
+
+    # Rendered help pages keyed by language, shared stylesheets keyed by theme
+    _html_cache = {}
+    _css_cache = {}
+    # Reusable markdown2 converter
+    _markdown = markdown2.Markdown(extras=["tables", "fenced-code-blocks"])
+
     def __init__(self, parent):
         super().__init__(parent)
         self.translator = get_translator()
         self.setWindowTitle("Help - Inventory Manager")
         self.setModal(True)
         self.setMinimumSize(900, 700)
-        self.setStyleSheet(
-            f"""
-            QWidget {{
+        # Styled by the cached app stylesheet (QDialog#helpDialog rules)
+        self.setObjectName("helpDialog")
+        self.setup_ui()
+
+    @classmethod
+    def get_help_html(cls, lang):
+        """Return the help HTML for a language, rendered once per process."""
+        html = cls._html_cache.get(lang)
+        if html is None:
+            html = cls._html_cache[lang] = cls.render_help_html(lang)
+        return html
+
+    @classmethod
+    def get_help_css(cls):
+        """Return the help stylesheet for the current theme, built once per theme."""
+        css = cls._css_cache.get(ModernStyle.current_theme)
+        if css is None:
+            css = cls._css_cache[ModernStyle.current_theme] = cls.build_help_css()
+        return css
+
+    @classmethod
+    def render_help_html(cls, lang):
+        """Convert the markdown help file for a language into HTML."""
+        help_file = os.path.join(cls.HELP_DIR, f"help_{lang}.md")
+
+        # Fallback to English if language file doesn't exist
+        if not os.path.exists(help_file):
+            help_file = os.path.join(cls.HELP_DIR, "help_en.md")
+
+        with open(help_file, "r", encoding="utf-8") as f:
+            return cls._markdown.convert(f.read())
+
+    @staticmethod
+    def build_help_css():
+        """Build the help stylesheet from the current theme colours."""
+        return f"""
+            body {{
+                font-family: Arial, sans-serif;
+                color: {ModernStyle.TEXT};
                 background-color: {ModernStyle.BACKGROUND};
+                padding: 20px;
+            }}
+            h1 {{
+                color: {ModernStyle.PRIMARY};
+                border-bottom: 2px solid {ModernStyle.PRIMARY};
+                padding-bottom: 10px;
+            }}
+            h2 {{
+                color: {ModernStyle.PRIMARY};
+                margin-top: 20px;
+            }}
+            h3 {{
+                color: {ModernStyle.TEXT};
+                margin-top: 15px;
+            }}
+            code {{
+                background-color: {ModernStyle.SURFACE};
+                padding: 2px 6px;
+                border-radius: 3px;
+                font-family: 'Consolas', 'Courier New', monospace;
+            }}
+            pre {{
+                background-color: {ModernStyle.SURFACE};
                 padding: 10px;
+                border-radius: 5px;
+                border: 1px solid {ModernStyle.BORDER};
+                overflow-x: auto;
+            }}
+            ul, ol {{
+                line-height: 1.6;
+            }}
+            hr {{
+                border: none;
+                border-top: 1px solid {ModernStyle.BORDER};
+                margin: 20px 0;
+            }}
+            strong {{
+                color: {ModernStyle.PRIMARY};
             }}
         """
-        )
-        self.setup_ui()
 
     def setup_ui(self):
         """Setup the help dialog UI with markdown content."""
-        import os
-        import markdown2
-
         layout = QVBoxLayout()
 
-        # Text browser for markdown content
-        text_browser = QTextEdit()
-        text_browser.setReadOnly(True)
-
-        # Load markdown file based on current language
-        lang = self.translator.current_language
-        help_file = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), "help", f"help_{lang}.md"
+        # Read-only rich-text label for markdown content, filled once the
+        # dialog is shown; the scroll area provides the scrollbars
+        self.help_label = QLabel()
+        self.help_label.setTextFormat(Qt.TextFormat.RichText)
+        self.help_label.setWordWrap(True)
+        self.help_label.setAlignment(Qt.AlignmentFlag.AlignTop)
+        self.help_label.setTextInteractionFlags(
+            Qt.TextInteractionFlag.TextSelectableByMouse
         )
+        self.help_label.setOpenExternalLinks(True)
+        self.content_loaded = False
 
-        # Fallback to English if language file doesn't exist
-        if not os.path.exists(help_file):
-            help_file = os.path.join(
-                os.path.dirname(os.path.dirname(__file__)), "help", "help_en.md"
-            )
-
-        try:
-            with open(help_file, "r", encoding="utf-8") as f:
-                markdown_content = f.read()
-                html_content = markdown2.markdown(
-                    markdown_content, extras=["tables", "fenced-code-blocks"]
-                )
-
-                # Apply styling based on theme
-                from .styles import ModernStyle
-
-                styled_html = f"""
-                <style>
-                    body {{
-                        font-family: Arial, sans-serif;
-                        color: {ModernStyle.TEXT};
-                        background-color: {ModernStyle.BACKGROUND};
-                        padding: 20px;
-                    }}
-                    h1 {{
-                        color: {ModernStyle.PRIMARY};
-                        border-bottom: 2px solid {ModernStyle.PRIMARY};
-                        padding-bottom: 10px;
-                    }}
-                    h2 {{
-                        color: {ModernStyle.PRIMARY};
-                        margin-top: 20px;
-                    }}
-                    h3 {{
-                        color: {ModernStyle.TEXT};
-                        margin-top: 15px;
-                    }}
-                    code {{
-                        background-color: {ModernStyle.SURFACE};
-                        padding: 2px 6px;
-                        border-radius: 3px;
-                        font-family: 'Consolas', 'Courier New', monospace;
-                    }}
-                    pre {{
-                        background-color: {ModernStyle.SURFACE};
-                        padding: 10px;
-                        border-radius: 5px;
-                        border: 1px solid {ModernStyle.BORDER};
-                        overflow-x: auto;
-                    }}
-                    ul, ol {{
-                        line-height: 1.6;
-                    }}
-                    hr {{
-                        border: none;
-                        border-top: 1px solid {ModernStyle.BORDER};
-                        margin: 20px 0;
-                    }}
-                    strong {{
-                        color: {ModernStyle.PRIMARY};
-                    }}
-                </style>
-                {html_content}
-                """
-                text_browser.setHtml(styled_html)
-        except Exception as e:
-            text_browser.setPlainText(f"Error loading help file: {e}")
-
-        layout.addWidget(text_browser)
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setWidget(self.help_label)
+        layout.addWidget(scroll)
 
         # Close button
         close_btn = QPushButton(self.translator.tr("btn_close"))
         close_btn.clicked.connect(self.accept)
         close_btn.setMaximumWidth(100)
-        close_btn.setStyleSheet(
-            f"""
-            QPushButton {{
-                background-color: red;
-            }}
-        """
-        )
+        close_btn.setObjectName("helpCloseBtn")
         layout.addWidget(close_btn, alignment=Qt.AlignmentFlag.AlignCenter)
 
         self.setLayout(layout)
+
+    def showEvent(self, event):
+        """Defer the rich-text layout until the dialog frame is on screen."""
+        super().showEvent(event)
+        if not self.content_loaded:
+            self.content_loaded = True
+            QTimer.singleShot(0, self.load_content)
+
+    def load_content(self):
+        """Load the help HTML into the help label."""
+        try:
+            html = self.get_help_html(self.translator.current_language)
+            self.help_label.setText(f"<style>{self.get_help_css()}</style>{html}")
+        except Exception as e:
+            self.help_label.setTextFormat(Qt.TextFormat.PlainText)
+            self.help_label.setText(f"Error loading help file: {e}")
@@ -2,6 +2,17 @@
 UI Styles and Themes
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+
+from PyQt6.QtGui import QFont
+
+
+@lru_cache(maxsize=None)
+def bold_font(point_size):
+    """Return a shared bold Arial font; built lazily, after the QApplication exists."""
+    return QFont("Arial", point_size, QFont.Weight.Bold)
+
 
 class ModernStyle:
     """Modern theme styles with dark and light modes."""
@@ -9,8 +20,8 @@ class ModernStyle:
     # Current theme (will be set dynamically)
     current_theme = "dark"
 
-    # Dark theme colors
-    DARK = {
+    # Dark theme colors (read-only so cached stylesheets cannot go stale)
+    DARK = MappingProxyType({
         "BACKGROUND": "#1a1a1a",
         "SURFACE": "#262626",
         "PRIMARY": "#33b36b",
@@ -24,10 +35,10 @@ class ModernStyle:
         "PRESSED_PRIMARY": "#258a50",
         "HOVER_DANGER": "#d63d3d",
         "HOVER_NEUTRAL": "#707070",
-    }
+    })
 
     # Light theme colors - Professional light color palette
-    LIGHT = {
+    LIGHT = MappingProxyType({
         "BACKGROUND": "#f8f9fa",        # Soft off-white background
         "SURFACE": "#ffffff",           # Pure white for cards/tables
         "PRIMARY": "#28a745",           # Professional green
@@ -41,7 +52,11 @@ class ModernStyle:
         "PRESSED_PRIMARY": "#1e7e34",   # Even darker when pressed
         "HOVER_DANGER": "#c82333",      # Darker red on hover
         "HOVER_NEUTRAL": "#5a6268",     # Dark gray on hover
-    }
+    })
+
+    # Palettes parsed to packed 0xRRGGBB ints for colour math (blending etc.)
+    DARK_RGB = MappingProxyType({k: int(v[1:], 16) for k, v in DARK.items()})
+    LIGHT_RGB = MappingProxyType({k: int(v[1:], 16) for k, v in LIGHT.items()})
 
     # Backward compatibility - default to dark theme
     BACKGROUND = DARK["BACKGROUND"]
@@ -52,9 +67,16 @@ class ModernStyle:
     TEXT_SECONDARY = DARK["TEXT_SECONDARY"]
     BORDER = DARK["BORDER"]
 
+    @staticmethod
+    def rgb_to_hex(rgb):
+        """Format a packed 0xRRGGBB int as a #rrggbb string."""
+        return f"#{rgb:06x}"
+
     @classmethod
     def set_theme(cls, theme_name):
         """Set the current theme (dark or light)."""
+        if theme_name == cls.current_theme:
+            return
         cls.current_theme = theme_name
         theme = cls.DARK if theme_name == "dark" else cls.LIGHT
         cls.BACKGROUND = theme["BACKGROUND"]
@@ -65,18 +87,46 @@ class ModernStyle:
         cls.TEXT_SECONDARY = theme["TEXT_SECONDARY"]
         cls.BORDER = theme["BORDER"]
 
+    @classmethod
+    def apply_theme(cls, window, theme_name):
+        """Switch theme and restyle a top-level window in a single repaint."""
+        cls.set_theme(theme_name)
+        stylesheet = cls.get_stylesheet()
+        if stylesheet == window.styleSheet():
+            return
+        # Hold repaints until every child has been restyled
+        window.setUpdatesEnabled(False)
+        try:
+            window.setStyleSheet(stylesheet)
+        finally:
+            window.setUpdatesEnabled(True)
+
     @classmethod
     def get_stylesheet(cls):
+        """Return the pre-built stylesheet for the current theme."""
+        return cls.STYLESHEETS[cls.current_theme]
+
+    @staticmethod
+    def build_stylesheet(theme):
+        """Format the application stylesheet for one theme palette."""
+        # Colours bound to locals once instead of a lookup per rule
+        background = theme["BACKGROUND"]
+        surface = theme["SURFACE"]
+        primary = theme["PRIMARY"]
+        danger = theme["DANGER"]
+        text = theme["TEXT"]
+        border = theme["BORDER"]
+        header = theme["HEADER"]
         return f"""
             QMainWindow, QDialog {{
-                background-color: {ModernStyle.BACKGROUND};
-                color: {ModernStyle.TEXT};
+                background-color: {background};
+                color: {text};
                 font-family: Inter;
             }}
 
             QTabWidget::pane {{
-                border: 1px solid {ModernStyle.BORDER};
-                background-color: {ModernStyle.BACKGROUND};
+                border: 1px solid {border};
+                background-color: {background};
                 border-top-left-radius: 0px;
                 border-top-right-radius: 8px;
                 border-bottom-left-radius: 8px;
@@ -85,8 +135,8 @@ class ModernStyle:
             }}
 
             QTabBar::tab {{
-                background-color: {ModernStyle.SURFACE};
-                color: {ModernStyle.TEXT};
+                background-color: {surface};
+                color: {text};
                 padding: 10px 20px;
                 margin-right: 5px;
                 border-top-left-radius: 8px;
@@ -98,48 +148,48 @@ class ModernStyle:
                 background-color: #3498db;
             }}
 
-            QTableWidget {{
-                background-color: {ModernStyle.BACKGROUND};
-                alternate-background-color: {ModernStyle.SURFACE};
-                color: {ModernStyle.TEXT};
-                gridline-color: {ModernStyle.BORDER};
+            QTableView {{
+                background-color: {background};
+                alternate-background-color: {surface};
+                color: {text};
+                gridline-color: {border};
                 font-family: Inter;
                 font-size: 14px;
             }}
 
-            QTableWidget::item {{
+            QTableView::item {{
                 padding-top: 8px;
                 padding-bottom: 8px;
-                border-right: 0px solid {ModernStyle.BORDER};
-                border-bottom: 0px solid {ModernStyle.BORDER};
+                border-right: 0px solid {border};
+                border-bottom: 0px solid {border};
                 border-left: none;
                 border-top: none;
                 outline: none;
             }}
-            QTableWidget::item:last {{
+            QTableView::item:last {{
                 padding-top: 2px;
                 padding-bottom: 2px;
             }}
 
-            QTableWidget::item:selected {{
+            QTableView::item:selected {{
                 background-color: #3498db;
                 outline: none;
             }}
 
-            QTableWidget::item:focus {{
+            QTableView::item:focus {{
                 outline: none;
             }}
 
-            QTableWidget:focus {{
+            QTableView:focus {{
                 outline: none;
             }}
 
             QHeaderView::section {{
-                background-color: {cls.DARK["HEADER"] if cls.current_theme == "dark" else cls.LIGHT["HEADER"]};
-                color: {ModernStyle.TEXT};
+                background-color: {header};
+                color: {text};
                 padding: 6px;
-                border-right: 1px solid {ModernStyle.BORDER};
-                border-bottom: 1px solid {ModernStyle.BORDER};
+                border-right: 1px solid {border};
+                border-bottom: 1px solid {border};
                 border-left: none;
                 border-top: none;
                 font-weight: bold;
@@ -154,8 +204,8 @@ class ModernStyle:
             }}
 
             QPushButton {{
-                background-color: {ModernStyle.PRIMARY};
-                color: {ModernStyle.TEXT};
+                background-color: {primary};
+                color: {text};
                 border: none;
                 padding: 4px 8px;
                 border-radius: 4px;
@@ -175,7 +225,7 @@ class ModernStyle:
             }}
 
             QPushButton.danger {{
-                background-color: {ModernStyle.DANGER};
+                background-color: {danger};
             }}
 
             QPushButton.danger:hover {{
@@ -190,10 +240,46 @@ class ModernStyle:
                 background-color: #707070;
             }}
 
+            QDialog#helpDialog, QDialog#helpDialog QWidget {{
+                background-color: {background};
+                padding: 10px;
+            }}
+
+            QPushButton#helpCloseBtn {{
+                background-color: red;
+            }}
+
+            QLabel#errorLabel {{
+                color: {danger};
+            }}
+
+            QTextEdit#errorText {{
+                background-color: {surface};
+                color: {danger};
+            }}
+
+            QWidget.separator {{
+                background-color: {border};
+            }}
+
+            QLabel.summary_ok, QLabel.summary_error {{
+                font-size: 14px;
+                font-weight: bold;
+                padding: 10px;
+            }}
+
+            QLabel.summary_ok {{
+                color: {primary};
+            }}
+
+            QLabel.summary_error {{
+                color: {danger};
+            }}
+
             QLineEdit, QComboBox, QSpinBox {{
-                background-color: {ModernStyle.SURFACE};
-                color: {ModernStyle.TEXT};
-                border: 1px solid {ModernStyle.BORDER};
+                background-color: {surface};
+                color: {text};
+                border: 1px solid {border};
                 padding: 8px;
                 border-radius: 8px;
                 font-family: Inter;
@@ -206,7 +292,7 @@ class ModernStyle:
             QComboBox::drop-down {{
                 border: none;
                 width: 30px;
-                background-color: {ModernStyle.SURFACE};
+                background-color: {surface};
                 border-radius: 8px;
             }}
 
@@ -218,13 +304,20 @@ class ModernStyle:
             }}
 
             QComboBox QAbstractItemView {{
-                background-color: {ModernStyle.SURFACE};
-                color: {ModernStyle.TEXT};
+                background-color: {surface};
+                color: {text};
                 selection-background-color: #3498db;
-                border: 1px solid {ModernStyle.BORDER};
+                border: 1px solid {border};
             }}
 
             QLabel {{
-                color: {ModernStyle.TEXT};
+                color: {text};
             }}
         """
+
+
+# Only two themes exist, so both stylesheets are formatted once at import
+ModernStyle.STYLESHEETS = MappingProxyType({
+    "dark": ModernStyle.build_stylesheet(ModernStyle.DARK),
+    "light": ModernStyle.build_stylesheet(ModernStyle.LIGHT),
+})
@@ -7,8 +7,7 @@ from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QPushButton,
     QLineEdit,
     QMessageBox,
@@ -16,16 +15,108 @@ from PyQt6.QtWidgets import (
     QAbstractItemView,
     QDialog,
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer, QAbstractTableModel, QModelIndex
 
-from .styles import ModernStyle
-from .dialogs import EditBoxDialog
+from .delegates import RowActionsDelegate
 from . import get_translator
 
 
+class BoxesModel(QAbstractTableModel):
+    """Read-only table model over (id, name, location) rows from SQLite."""
+
+    # Data columns; the last column is painted by RowActionsDelegate
+    DATA_COLUMNS = 3
+
+    # Roles resolved once; data() runs for every visible cell and role
+    DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+    ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+    CENTER = Qt.AlignmentFlag.AlignCenter
+
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self.rows = []
+        self.headers = headers
+
+    def set_rows(self, rows):
+        """Replace the rows with a fresh fetchall() result."""
+        self.beginResetModel()
+        self.rows = rows
+        self.endResetModel()
+
+    def row_of(self, box_id):
+        """Return the row showing box_id, or None if it is filtered out."""
+        for row, values in enumerate(self.rows):
+            if values[0] == box_id:
+                return row
+        return None
+
+    def append_row(self, values):
+        """Add one box at the end (new ids sort last)."""
+        row = len(self.rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.rows.append(values)
+        self.endInsertRows()
+
+    def replace_row(self, row, values):
+        """Update one box in place and repaint only its cells."""
+        self.rows[row] = values
+        self.dataChanged.emit(
+            self.index(row, 0), self.index(row, self.DATA_COLUMNS - 1)
+        )
+
+    def remove_row(self, row):
+        """Drop one box from the view."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.rows[row]
+        self.endRemoveRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        column = index.column()
+        if role == self.DISPLAY_ROLE:
+            if column == 0:
+                return str(self.rows[index.row()][0])
+            if column < self.DATA_COLUMNS:
+                return self.rows[index.row()][column] or ""
+            return None
+        if role == self.ALIGNMENT_ROLE:
+            return self.CENTER
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+
 class BoxesTab(QWidget):
     """Tab for managing boxes."""
 
+    # Delay between the last search keystroke and the table reload
+    SEARCH_DEBOUNCE_MS = 150
+
+    # Fixed query strings so sqlite3's statement cache always hits
+    SQL_ALL = "SELECT id, name, location FROM boxes ORDER BY id"
+    SQL_SEARCH = (
+        "SELECT id, name, location FROM boxes "
+        "WHERE name LIKE ? OR location LIKE ? ORDER BY id"
+    )
+    SQL_FTS_SEARCH = (
+        "SELECT b.id, b.name, b.location FROM boxes_fts f "
+        "JOIN boxes b ON b.id = f.rowid WHERE boxes_fts MATCH ? ORDER BY b.id"
+    )
+
     def __init__(self, parent):
         super().__init__(parent)
         self.translator = get_translator()
@@ -36,12 +127,21 @@ class BoxesTab(QWidget):
         tr = self.parent.translator
         layout = QVBoxLayout()
 
+        # Row action labels, looked up once instead of per row
+        self.edit_label = tr.tr('btn_edit')
+        self.delete_label = tr.tr('btn_delete')
+
         # Search bar
         search_layout = QHBoxLayout()
 
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText(tr.tr('placeholder_search_boxes'))
-        self.search_input.textChanged.connect(self.load_boxes)
+        # Reload once typing pauses instead of on every keystroke
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.load_boxes)
+        self.search_input.textChanged.connect(self.search_timer.start)
         search_layout.addWidget(self.search_input, 4)
 
         clear_btn = QPushButton(tr.tr('btn_clear_search'))
@@ -56,14 +156,14 @@ class BoxesTab(QWidget):
         layout.addLayout(search_layout)
 
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels([
+        self.table = QTableView()
+        self.model = BoxesModel([
             tr.tr('header_id'),
             tr.tr('header_box_name'),
             tr.tr('header_location'),
             tr.tr('header_actions')
-        ])
+        ], self)
+        self.table.setModel(self.model)
 
         # Set column widths
         header = self.table.horizontalHeader()
@@ -81,128 +181,107 @@ class BoxesTab(QWidget):
         self.table.setAlternatingRowColors(True)
         self.table.verticalHeader().setVisible(False)  # Hide row numbers
         self.table.verticalHeader().setDefaultSectionSize(50)  # Fixed row height
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+
+        # Edit/Delete buttons are painted by a delegate, not per-row widgets
+        self.actions_delegate = RowActionsDelegate(
+            self.edit_label, self.delete_label, self.table
+        )
+        self.actions_delegate.edit_requested.connect(self.on_edit_requested)
+        self.actions_delegate.delete_requested.connect(self.on_delete_requested)
+        self.table.setItemDelegateForColumn(3, self.actions_delegate)
+        self.table.setMouseTracking(True)
 
         layout.addWidget(self.table)
 
+        # Message boxes built once and reused for every confirm/success popup
+        self.confirm_box = QMessageBox(self)
+        self.confirm_box.setIcon(QMessageBox.Icon.Question)
+        self.confirm_box.setStandardButtons(
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        self.info_box = QMessageBox(self)
+        self.info_box.setIcon(QMessageBox.Icon.Information)
+
         self.setLayout(layout)
         self.load_boxes()
 
     def load_boxes(self):
         """Load boxes into table."""
-        tr = self.parent.translator
-        self.table.setRowCount(0)
-
-        query = "SELECT id, name, location FROM boxes WHERE 1=1"
-        params = []
-
+        cursor = self.parent.cursor
         search_text = self.search_input.text().strip()
-        if search_text:
-            query += " AND (name LIKE ? OR location LIKE ?)"
-            params.append(f"%{search_text}%")
-            params.append(f"%{search_text}%")
-
-        query += " ORDER BY id"
-
-        self.parent.cursor.execute(query, params)
-        boxes = self.parent.cursor.fetchall()
-
-        for row_idx, (box_id, name, location) in enumerate(boxes):
-            self.table.insertRow(row_idx)
-
-            # ID
-            id_item = QTableWidgetItem(str(box_id))
-            id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row_idx, 0, id_item)
-
-            # Name
-            name_item = QTableWidgetItem(name)
-            name_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row_idx, 1, name_item)
-
-            # Location
-            location_item = QTableWidgetItem(location or "")
-            location_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row_idx, 2, location_item)
-
-            # Actions
-            actions_widget = QWidget()
-            actions_widget.setStyleSheet("QWidget { background: transparent; border: none; }")
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.setContentsMargins(0, 0, 0, 0)
-            actions_layout.setSpacing(5)
-            actions_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-            edit_btn = QPushButton(tr.tr('btn_edit'))
-            edit_btn.setFixedSize(45, 22)
-            edit_btn.setStyleSheet(
-                f"""
-                QPushButton {{
-                    background-color: {ModernStyle.PRIMARY};
-                    color: {ModernStyle.TEXT};
-                    border: none;
-                    padding: 1px;
-                    border-radius: 4px;
-                    font-size: 11px;
-                }}
-                QPushButton:hover {{
-                    background-color: #2da35f;
-                }}
-            """
-            )
-            edit_btn.clicked.connect(
-                lambda checked, i=box_id, n=name, loc=location: self.edit_box(i, n, loc)
-            )
-            actions_layout.addWidget(edit_btn)
-
-            delete_btn = QPushButton(tr.tr('btn_delete'))
-            delete_btn.setFixedSize(45, 22)
-            delete_btn.setStyleSheet(
-                f"""
-                QPushButton {{
-                    background-color: {ModernStyle.DANGER};
-                    color: {ModernStyle.TEXT};
-                    border: none;
-                    padding: 1px;
-                    border-radius: 4px;
-                    height: 10px;
-                    font-size: 11px;
-                }}
-                QPushButton:hover {{
-                    background-color: #d63d3d;
-                }}
-            """
-            )
-            delete_btn.clicked.connect(lambda checked, i=box_id: self.delete_box(i))
-            actions_layout.addWidget(delete_btn)
-
-            self.table.setCellWidget(row_idx, 3, actions_widget)
+        match = self.parent.fts_query(search_text)
+        if match:
+            # Substring match through the trigram index instead of a table scan
+            cursor.execute(self.SQL_FTS_SEARCH, (match,))
+        elif search_text:
+            pattern = f"%{search_text}%"
+            cursor.execute(self.SQL_SEARCH, (pattern, pattern))
+        else:
+            cursor.execute(self.SQL_ALL)
+
+        # The fetched rows are the model storage; no per-cell items are built
+        self.model.set_rows(cursor.fetchall())
+
+    def show_info(self, title, text):
+        """Show the shared information box."""
+        self.info_box.setWindowTitle(title)
+        self.info_box.setText(text)
+        self.info_box.exec()
+
+    def confirm(self, title, text):
+        """Ask a Yes/No question with the shared confirm box."""
+        self.confirm_box.setWindowTitle(title)
+        self.confirm_box.setText(text)
+        return self.confirm_box.exec() == QMessageBox.StandardButton.Yes
+
+    def refresh_item_box_filter(self):
+        """Reload the items tab's box list, if that tab has been built."""
+        if self.parent.items_tab is not None:
+            self.parent.items_tab.load_box_filter()
+
+    def on_edit_requested(self, row):
+        """Edit the box shown in a table row."""
+        box_id, name, location = self.model.rows[row]
+        self.edit_box(box_id, name, location or "")
+
+    def on_delete_requested(self, row):
+        """Delete the box shown in a table row."""
+        self.delete_box(self.model.rows[row][0])
 
     def add_box(self):
         """Show add box dialog."""
+        from .dialogs import EditBoxDialog
+
         dialog = EditBoxDialog(self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             name, location = dialog.result
             try:
-                self.parent.cursor.execute(
-                    "INSERT INTO boxes (name, location) VALUES (?, ?)", (name, location)
-                )
-                box_id = self.parent.cursor.lastrowid
-                self.parent.conn.commit()
-
-                # Log the action
                 details = f"Created new box at location: {location}" if location else "Created new box"
-                self.parent.log_action(
-                    action="CREATE",
-                    entity_type="BOX",
-                    entity_id=box_id,
-                    entity_name=name,
-                    details=details
-                )
 
-                QMessageBox.information(self, "Success", "Box added successfully")
-                self.load_boxes()
+                # Box and audit row commit together; rolled back on error
+                with self.parent.transaction():
+                    self.parent.cursor.execute(
+                        "INSERT INTO boxes (name, location) VALUES (?, ?)", (name, location)
+                    )
+                    box_id = self.parent.cursor.lastrowid
+                    self.parent.log_action(
+                        action="CREATE",
+                        entity_type="BOX",
+                        entity_id=box_id,
+                        entity_name=name,
+                        details=details
+                    )
+                self.parent.data_version += 1
+
+                self.show_info("Success", "Box added successfully")
+                self.refresh_item_box_filter()
+                if self.search_input.text().strip():
+                    # The new box may not match the active filter
+                    self.load_boxes()
+                else:
+                    self.model.append_row((box_id, name, location))
             except sqlite3.Error as e:
-                self.parent.conn.rollback()
                 QMessageBox.critical(self, "Error", f"Database error: {e}")
 
     def edit_box(self, box_id, name, location):
@@ -211,73 +290,77 @@ class BoxesTab(QWidget):
         old_name = name
         old_location = location
 
+        from .dialogs import EditBoxDialog
+
         dialog = EditBoxDialog(self, box_data)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             new_name, new_location = dialog.result
             try:
-                self.parent.cursor.execute(
-                    "UPDATE boxes SET name = ?, location = ? WHERE id = ?", (new_name, new_location, box_id)
-                )
-                self.parent.conn.commit()
-
-                # Log the action
                 changes = []
                 if old_name != new_name:
                     changes.append(f"name: '{old_name}' → '{new_name}'")
                 if old_location != new_location:
                     changes.append(f"location: '{old_location or 'None'}' → '{new_location or 'None'}'")
-
                 change_details = ", ".join(changes) if changes else "No changes"
-                self.parent.log_action(
-                    action="UPDATE",
-                    entity_type="BOX",
-                    entity_id=box_id,
-                    entity_name=new_name,
-                    details=change_details,
-                    old_value=f"name: {old_name}, location: {old_location}",
-                    new_value=f"name: {new_name}, location: {new_location}"
-                )
 
-                QMessageBox.information(self, "Success", "Box updated successfully")
-                self.load_boxes()
+                # Update and audit row commit together; rolled back on error
+                with self.parent.transaction():
+                    self.parent.cursor.execute(
+                        "UPDATE boxes SET name = ?, location = ? WHERE id = ?", (new_name, new_location, box_id)
+                    )
+                    self.parent.log_action(
+                        action="UPDATE",
+                        entity_type="BOX",
+                        entity_id=box_id,
+                        entity_name=new_name,
+                        details=change_details,
+                        old_value=f"name: {old_name}, location: {old_location}",
+                        new_value=f"name: {new_name}, location: {new_location}"
+                    )
+                self.parent.data_version += 1
+
+                self.show_info("Success", "Box updated successfully")
+                self.refresh_item_box_filter()
+                row = self.model.row_of(box_id)
+                if self.search_input.text().strip() or row is None:
+                    # The edit may move the box in or out of the active filter
+                    self.load_boxes()
+                else:
+                    self.model.replace_row(row, (box_id, new_name, new_location))
             except sqlite3.Error as e:
-                self.parent.conn.rollback()
                 QMessageBox.critical(self, "Error", f"Database error: {e}")
 
     def delete_box(self, box_id):
         """Delete a box."""
-        reply = QMessageBox.question(
-            self,
+        if self.confirm(
             "Confirm Delete",
             "Are you sure you want to delete this box and all its items?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-        )
-
-        if reply == QMessageBox.StandardButton.Yes:
+        ):
             try:
-                # Get box details before deletion for logging
-                self.parent.cursor.execute("SELECT name FROM boxes WHERE id = ?", (box_id,))
-                box_data = self.parent.cursor.fetchone()
-                box_name = box_data[0] if box_data else "Unknown"
-
-                # Count items in box
-                self.parent.cursor.execute("SELECT COUNT(*) FROM items WHERE box_id = ?", (box_id,))
-                item_count = self.parent.cursor.fetchone()[0]
-
-                self.parent.cursor.execute("DELETE FROM boxes WHERE id = ?", (box_id,))
-                self.parent.conn.commit()
-
-                # Log the action
-                self.parent.log_action(
-                    action="DELETE",
-                    entity_type="BOX",
-                    entity_id=box_id,
-                    entity_name=box_name,
-                    details=f"Deleted box with {item_count} items"
+                # Name and item count for the log in one query
+                self.parent.cursor.execute(
+                    "SELECT b.name, (SELECT COUNT(*) FROM items WHERE box_id = b.id) "
+                    "FROM boxes b WHERE b.id = ?",
+                    (box_id,),
                 )
-
-                QMessageBox.information(self, "Success", "Box deleted successfully")
-                self.load_boxes()
+                box_name, item_count = self.parent.cursor.fetchone() or ("Unknown", 0)
+
+                # Delete and audit row commit together; rolled back on error
+                with self.parent.transaction():
+                    self.parent.cursor.execute("DELETE FROM boxes WHERE id = ?", (box_id,))
+                    self.parent.log_action(
+                        action="DELETE",
+                        entity_type="BOX",
+                        entity_id=box_id,
+                        entity_name=box_name,
+                        details=f"Deleted box with {item_count} items"
+                    )
+                self.parent.data_version += 1
+
+                self.show_info("Success", "Box deleted successfully")
+                self.refresh_item_box_filter()
+                row = self.model.row_of(box_id)
+                if row is not None:
+                    self.model.remove_row(row)
             except sqlite3.Error as e:
-                self.parent.conn.rollback()
                 QMessageBox.critical(self, "Error", f"Database error: {e}")
@@ -2,12 +2,14 @@
 History Tab
 """
 
+import sys
+from itertools import product
+
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QPushButton,
     QLineEdit,
     QLabel,
@@ -15,20 +17,155 @@ from PyQt6.QtWidgets import (
     QHeaderView,
     QAbstractItemView,
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QColor
+from PyQt6.QtCore import Qt, QTimer, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QBrush, QColor
 
 from .styles import ModernStyle
 from . import get_translator
 
 
+# Entity name search: none, LIKE scan, or the audit_logs_fts trigram index
+SEARCH_FILTERS = {
+    None: "",
+    "like": " AND a.entity_name LIKE ?",
+    "fts": " AND audit_logs_fts MATCH ?",
+}
+
+# Characters of details fetched for the table; the full text is loaded
+# for the selected row only
+DETAILS_PREVIEW_LENGTH = 200
+
+# Every filter combination pre-built, keyed by (action set, entity type set,
+# search mode), so load_logs never assembles SQL and sqlite3's statement
+# cache hits
+LOG_QUERIES = {
+    (has_action, has_type, search): (
+        "SELECT a.timestamp, a.action, a.entity_type, a.entity_name,"
+        f" substr(a.details, 1, {DETAILS_PREVIEW_LENGTH}), a.entity_id, a.id"
+        " FROM audit_logs a"
+        + (" JOIN audit_logs_fts ON audit_logs_fts.rowid = a.id" if search == "fts" else "")
+        + " WHERE a.id < ?"
+        + (" AND a.action = ?" if has_action else "")
+        + (" AND a.entity_type = ?" if has_type else "")
+        + SEARCH_FILTERS[search]
+        + " ORDER BY a.id DESC LIMIT ?"
+    )
+    for has_action, has_type, search in product(
+        (False, True), (False, True), SEARCH_FILTERS
+    )
+}
+
+
+class AuditLogModel(QAbstractTableModel):
+    """Read-only table model over audit_logs rows.
+
+    Rows are (timestamp, action, entity_type, entity_name, details preview,
+    entity_id, id); the trailing audit_logs id is the keyset for paging and
+    not shown.
+    """
+
+    ACTION_COLUMN = 1
+    ENTITY_COLUMN = 3
+    DETAILS_COLUMN = 4
+    ID_COLUMN = 5
+
+    CENTER = Qt.AlignmentFlag.AlignCenter
+    LEFT = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+
+    # Roles resolved once; data() runs for every visible cell and role
+    DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+    ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+    FOREGROUND_ROLE = Qt.ItemDataRole.ForegroundRole
+
+    # Action colour brushes, built once per theme
+    _brush_cache = {}
+
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self.rows = []
+        self.headers = headers
+        self.action_brushes = {}
+
+    @classmethod
+    def get_action_brushes(cls):
+        """Return the action -> QBrush map for the current theme."""
+        brushes = cls._brush_cache.get(ModernStyle.current_theme)
+        if brushes is None:
+            brushes = cls._brush_cache[ModernStyle.current_theme] = {
+                "CREATE": QBrush(QColor(ModernStyle.PRIMARY)),
+                "UPDATE": QBrush(QColor("#3498db")),
+                "DELETE": QBrush(QColor(ModernStyle.DANGER)),
+            }
+        return brushes
+
+    def set_rows(self, rows):
+        """Replace the rows with a fresh fetchall() result."""
+        self.beginResetModel()
+        self.rows = rows
+        self.action_brushes = self.get_action_brushes()
+        self.endResetModel()
+
+    def append_rows(self, rows):
+        """Add the next page of older rows at the bottom."""
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self.rows.extend(rows)
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        column = index.column()
+        if role == self.DISPLAY_ROLE:
+            value = self.rows[index.row()][column]
+            if column == self.ID_COLUMN:
+                return str(value) if value else ""
+            if column == self.ENTITY_COLUMN:
+                return value or "N/A"
+            return value or ""
+        if role == self.ALIGNMENT_ROLE:
+            return self.LEFT if column == self.DETAILS_COLUMN else self.CENTER
+        if role == self.FOREGROUND_ROLE and column == self.ACTION_COLUMN:
+            return self.action_brushes.get(self.rows[index.row()][column])
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+
 class HistoryTab(QWidget):
     """Tab for viewing audit logs and transaction history."""
 
+    # Values offered by the action and entity type filter dropdowns
+    ACTION_FILTERS = ("CREATE", "UPDATE", "DELETE")
+    ENTITY_FILTERS = ("ITEM", "BOX")
+
+    # Delay between the last search keystroke and the table reload
+    SEARCH_DEBOUNCE_MS = 150
+
+    # Rows fetched per page; older pages load as the table is scrolled down
+    PAGE_SIZE = 100
+    # Rows from the bottom at which the next page is requested
+    FETCH_MORE_THRESHOLD = 20
+
     def __init__(self, parent):
         super().__init__(parent)
         self.translator = get_translator()
         self.parent = parent
+        self.loaded_filters = None
+        self.stats_max_id = -1
         self.setup_ui()
 
     def setup_ui(self):
@@ -39,27 +176,27 @@ class HistoryTab(QWidget):
 
         # Action filter
         self.action_filter = QComboBox()
-        self.action_filter.addItem("All Actions", None)
-        self.action_filter.addItem("CREATE", "CREATE")
-        self.action_filter.addItem("UPDATE", "UPDATE")
-        self.action_filter.addItem("DELETE", "DELETE")
-        self.action_filter.currentIndexChanged.connect(self.load_logs)
+        self.populate_filter(self.action_filter, "All Actions", self.ACTION_FILTERS)
+        self.action_filter.currentIndexChanged.connect(self.apply_filters)
         filter_layout.addWidget(QLabel("Action:"))
         filter_layout.addWidget(self.action_filter, 1)
 
         # Entity type filter
         self.entity_filter = QComboBox()
-        self.entity_filter.addItem("All Types", None)
-        self.entity_filter.addItem("ITEM", "ITEM")
-        self.entity_filter.addItem("BOX", "BOX")
-        self.entity_filter.currentIndexChanged.connect(self.load_logs)
+        self.populate_filter(self.entity_filter, "All Types", self.ENTITY_FILTERS)
+        self.entity_filter.currentIndexChanged.connect(self.apply_filters)
         filter_layout.addWidget(QLabel("Type:"))
         filter_layout.addWidget(self.entity_filter, 1)
 
         # Search by entity name
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText(self.translator.tr('placeholder_search_history'))
-        self.search_input.textChanged.connect(self.load_logs)
+        # Reload once typing pauses instead of on every keystroke
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.apply_filters)
+        self.search_input.textChanged.connect(self.search_timer.start)
         filter_layout.addWidget(self.search_input, 2)
 
         clear_btn = QPushButton(self.translator.tr('btn_clear_filters'))
@@ -74,16 +211,16 @@ class HistoryTab(QWidget):
         layout.addLayout(filter_layout)
 
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels([
+        self.table = QTableView()
+        self.model = AuditLogModel([
             self.translator.tr('label_timestamp'),
             self.translator.tr('label_action'),
             self.translator.tr('label_type'),
             self.translator.tr('label_entity'),
             self.translator.tr('label_details'),
             self.translator.tr('header_id')
-        ])
+        ], self)
+        self.table.setModel(self.model)
 
         # Set column widths
         header = self.table.horizontalHeader()
@@ -101,9 +238,20 @@ class HistoryTab(QWidget):
         self.table.setAlternatingRowColors(True)
         self.table.verticalHeader().setVisible(False)
         self.table.verticalHeader().setDefaultSectionSize(40)
+        self.table.verticalScrollBar().valueChanged.connect(self.on_scrolled)
+        self.table.selectionModel().currentRowChanged.connect(self.show_details)
 
         layout.addWidget(self.table)
 
+        # Full details of the selected log (the table only holds a preview)
+        self.details_label = QLabel()
+        self.details_label.setWordWrap(True)
+        self.details_label.setTextInteractionFlags(
+            Qt.TextInteractionFlag.TextSelectableByMouse
+        )
+        self.details_label.setVisible(False)
+        layout.addWidget(self.details_label)
+
         # Stats summary
         self.stats_label = QLabel()
         self.stats_label.setStyleSheet(
@@ -114,109 +262,111 @@ class HistoryTab(QWidget):
         self.setLayout(layout)
         self.load_logs()
 
+    @staticmethod
+    def populate_filter(combo, all_label, values):
+        """Fill a filter dropdown in one batch; item data is the filter value."""
+        combo.addItems([all_label, *values])
+        for index, value in enumerate(values, 1):
+            combo.setItemData(index, value)
+
     def clear_filters(self):
         """Clear all filters."""
         self.action_filter.setCurrentIndex(0)
         self.entity_filter.setCurrentIndex(0)
         self.search_input.clear()
 
-    def load_logs(self):
-        """Load audit logs into table."""
-        self.table.setRowCount(0)
+    def filter_key(self):
+        """Return the current (action, entity type, search text) filters."""
+        return (
+            self.action_filter.currentData(),
+            self.entity_filter.currentData(),
+            self.search_input.text().strip(),
+        )
 
-        query = """
-            SELECT timestamp, action, entity_type, entity_name, details, entity_id
-            FROM audit_logs
-            WHERE 1=1
-        """
-        params = []
+    def apply_filters(self):
+        """Reload after a filter edit, unless the filters ended up unchanged."""
+        if self.filter_key() != self.loaded_filters:
+            self.load_logs()
 
+    def load_logs(self):
+        """Load audit logs into table."""
         # Apply filters
-        action = self.action_filter.currentData()
-        if action:
-            query += " AND action = ?"
-            params.append(action)
-
-        entity_type = self.entity_filter.currentData()
-        if entity_type:
-            query += " AND entity_type = ?"
-            params.append(entity_type)
-
-        search_text = self.search_input.text().strip()
-        if search_text:
-            query += " AND entity_name LIKE ?"
-            params.append(f"%{search_text}%")
-
-        query += " ORDER BY id DESC LIMIT 1000"
-
-        self.parent.cursor.execute(query, params)
-        logs = self.parent.cursor.fetchall()
-
-        for row_idx, (
-            timestamp,
-            action,
-            entity_type,
-            entity_name,
-            details,
-            entity_id,
-        ) in enumerate(logs):
-            self.table.insertRow(row_idx)
-
-            # Timestamp
-            time_item = QTableWidgetItem(timestamp)
-            time_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row_idx, 0, time_item)
-
-            # Action with color coding
-            action_item = QTableWidgetItem(action)
-            action_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            if action == "CREATE":
-                action_item.setForeground(QColor(ModernStyle.PRIMARY))
-            elif action == "UPDATE":
-                action_item.setForeground(QColor("#3498db"))
-            elif action == "DELETE":
-                action_item.setForeground(QColor(ModernStyle.DANGER))
-            self.table.setItem(row_idx, 1, action_item)
-
-            # Type
-            type_item = QTableWidgetItem(entity_type)
-            type_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row_idx, 2, type_item)
-
-            # Entity name
-            entity_item = QTableWidgetItem(entity_name or "N/A")
-            entity_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row_idx, 3, entity_item)
-
-            # Details
-            details_item = QTableWidgetItem(details or "")
-            details_item.setTextAlignment(
-                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
-            )
-            self.table.setItem(row_idx, 4, details_item)
-
-            # ID
-            id_item = QTableWidgetItem(str(entity_id) if entity_id else "")
-            id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row_idx, 5, id_item)
+        self.loaded_filters = self.filter_key()
+        action, entity_type, search_text = self.loaded_filters
+        match = self.parent.fts_query(search_text)
+        if match:
+            search, search_param = "fts", match
+        elif search_text:
+            search, search_param = "like", f"%{search_text}%"
+        else:
+            search, search_param = None, None
+        self.page_query = LOG_QUERIES[bool(action), bool(entity_type), search]
+        self.page_params = [
+            value for value in (action, entity_type, search_param) if value
+        ]
+
+        # First page; later pages continue below the last id already shown.
+        # The fetched rows are the model storage; no per-cell items are built
+        self.model.set_rows(self.fetch_page(sys.maxsize))
+        # A model reset drops the current row without emitting currentRowChanged
+        self.details_label.clear()
+        self.details_label.setVisible(False)
 
         # Update stats
         self.update_stats()
 
+    def fetch_page(self, before_id):
+        """Fetch the next page of filtered logs with ids below before_id."""
+        self.parent.cursor.execute(
+            self.page_query, (before_id, *self.page_params, self.PAGE_SIZE)
+        )
+        rows = self.parent.cursor.fetchall()
+        self.has_more_logs = len(rows) == self.PAGE_SIZE
+        return rows
+
+    def on_scrolled(self, value):
+        """Append the next page once the view nears the bottom."""
+        scrollbar = self.table.verticalScrollBar()
+        if not self.has_more_logs or value < scrollbar.maximum() - self.FETCH_MORE_THRESHOLD:
+            return
+        rows = self.fetch_page(self.model.rows[-1][-1])
+        if rows:
+            self.model.append_rows(rows)
+
+    def show_details(self, current, previous):
+        """Load the full details text of the newly selected log."""
+        details = None
+        if current.isValid():
+            self.parent.cursor.execute(
+                "SELECT details FROM audit_logs WHERE id = ?",
+                (self.model.rows[current.row()][-1],),
+            )
+            row = self.parent.cursor.fetchone()
+            details = row[0] if row else None
+        self.details_label.setText(details or "")
+        self.details_label.setVisible(bool(details))
+
     def update_stats(self):
         """Update statistics label."""
-        # Count by action type
+        # Logs are only ever appended, so an unchanged max id means unchanged counts
+        self.parent.cursor.execute("SELECT MAX(id) FROM audit_logs")
+        max_id = self.parent.cursor.fetchone()[0]
+        if max_id == self.stats_max_id:
+            return
+        self.stats_max_id = max_id
+
+        # Count by action type in a single row
         self.parent.cursor.execute(
             """
-            SELECT action, COUNT(*) FROM audit_logs GROUP BY action
+            SELECT
+                COUNT(*),
+                COALESCE(SUM(action = 'CREATE'), 0),
+                COALESCE(SUM(action = 'UPDATE'), 0),
+                COALESCE(SUM(action = 'DELETE'), 0)
+            FROM audit_logs
         """
         )
-        stats = dict(self.parent.cursor.fetchall())
-
-        total = sum(stats.values())
-        creates = stats.get("CREATE", 0)
-        updates = stats.get("UPDATE", 0)
-        deletes = stats.get("DELETE", 0)
+        total, creates, updates, deletes = self.parent.cursor.fetchone()
 
         self.stats_label.setText(
             f"Total Logs: {total} | Creates: {creates} | Updates: {updates} | Deletes: {deletes}"
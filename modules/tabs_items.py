@@ -2,7 +2,9 @@
 Items Tab
 """
 
+import json
 import sqlite3
+from itertools import product
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -17,20 +19,46 @@ from PyQt6.QtWidgets import (
     QAbstractItemView,
     QDialog,
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QSignalBlocker, QTimer
 
-from .styles import ModernStyle
-from .dialogs import EditItemDialog
+from .delegates import RowActionsDelegate
 from . import get_translator
 
 
+# Item name search: none, LIKE scan, or the items_fts trigram index
+SEARCH_FILTERS = {
+    None: "",
+    "like": " AND items.name LIKE ?",
+    "fts": " AND items_fts MATCH ?",
+}
+
+# Every filter combination pre-built, keyed by (search mode, box set),
+# so load_items never assembles SQL and sqlite3's statement cache hits
+ITEM_QUERIES = {
+    (search, has_box): (
+        "SELECT items.id, items.name, boxes.name, items.quantity, items.box_id"
+        " FROM items"
+        + (" JOIN items_fts ON items_fts.rowid = items.id" if search == "fts" else "")
+        + " LEFT JOIN boxes ON items.box_id = boxes.id WHERE 1=1"
+        + SEARCH_FILTERS[search]
+        + (" AND items.box_id = ?" if has_box else "")
+        + " ORDER BY items.id"
+    )
+    for search, has_box in product(SEARCH_FILTERS, (False, True))
+}
+
+
 class ItemsTab(QWidget):
     """Tab for managing items."""
 
+    # Delay between the last search keystroke and the table reload
+    SEARCH_DEBOUNCE_MS = 150
+
     def __init__(self, parent):
         super().__init__(parent)
         self.translator = get_translator()
         self.parent = parent
+        self.loaded_filters = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -41,13 +69,18 @@ class ItemsTab(QWidget):
 
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText(self.translator.tr('placeholder_search_items'))
-        self.search_input.textChanged.connect(self.load_items)
+        # Reload once typing pauses instead of on every keystroke
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.apply_filters)
+        self.search_input.textChanged.connect(self.search_timer.start)
         filter_layout.addWidget(self.search_input, 2)
 
         self.box_filter = QComboBox()
         self.box_filter.addItem(self.translator.tr('filter_all_boxes'), None)
         self.load_box_filter()
-        self.box_filter.currentIndexChanged.connect(self.load_items)
+        self.box_filter.currentIndexChanged.connect(self.apply_filters)
         filter_layout.addWidget(self.box_filter, 2)
 
         clear_btn = QPushButton(self.translator.tr('btn_clear_filters'))
@@ -92,6 +125,15 @@ class ItemsTab(QWidget):
         self.table.verticalHeader().setVisible(False)  # Hide row numbers
         self.table.verticalHeader().setDefaultSectionSize(50)  # Fixed row height
 
+        # Edit/Delete buttons are painted by a delegate, not per-row widgets
+        self.actions_delegate = RowActionsDelegate(
+            self.translator.tr('btn_edit'), self.translator.tr('btn_delete'), self.table
+        )
+        self.actions_delegate.edit_requested.connect(self.on_edit_requested)
+        self.actions_delegate.delete_requested.connect(self.on_delete_requested)
+        self.table.setItemDelegateForColumn(4, self.actions_delegate)
+        self.table.setMouseTracking(True)
+
         layout.addWidget(self.table)
 
         self.setLayout(layout)
@@ -99,121 +141,100 @@ class ItemsTab(QWidget):
 
     def load_box_filter(self):
         """Load boxes into filter dropdown."""
-        # Clear existing items except "All Boxes"
-        while self.box_filter.count() > 1:
-            self.box_filter.removeItem(1)
-
-        self.parent.cursor.execute("SELECT id, name FROM boxes ORDER BY name")
-        boxes = self.parent.cursor.fetchall()
-
-        for box_id, name in boxes:
-            self.box_filter.addItem(name, box_id)
+        selected = self.box_filter.currentData()
+        with QSignalBlocker(self.box_filter):
+            # Clear existing items except "All Boxes"
+            while self.box_filter.count() > 1:
+                self.box_filter.removeItem(1)
+
+            # Box names are also kept by id for audit log messages
+            self.box_names = {}
+            self.parent.cursor.execute("SELECT id, name FROM boxes ORDER BY name")
+            for box_id, name in self.parent.cursor:
+                self.box_filter.addItem(name, box_id)
+                self.box_names[box_id] = name
+
+            index = self.box_filter.findData(selected) if selected else 0
+            self.box_filter.setCurrentIndex(max(index, 0))
+
+        if selected and index < 0:
+            # The filtered box was deleted; show all items again
+            self.load_items()
+
+    def box_name(self, box_id):
+        """Return a box name from the cache, querying once on a miss."""
+        name = self.box_names.get(box_id)
+        if name is None:
+            self.parent.cursor.execute("SELECT name FROM boxes WHERE id = ?", (box_id,))
+            row = self.parent.cursor.fetchone()
+            name = self.box_names[box_id] = row[0] if row else "Unknown"
+        return name
+
+    def filter_key(self):
+        """Return the current (search text, box id) filters."""
+        return self.search_input.text().strip(), self.box_filter.currentData()
+
+    def apply_filters(self):
+        """Reload after a filter edit, unless the filters ended up unchanged."""
+        if self.filter_key() != self.loaded_filters:
+            self.load_items()
 
     def load_items(self):
         """Load items into table."""
-        self.table.setRowCount(0)
-
-        query = """
-            SELECT items.id, items.name, boxes.name, items.quantity, items.box_id
-            FROM items
-            LEFT JOIN boxes ON items.box_id = boxes.id
-            WHERE 1=1
-        """
-        params = []
-
         # Apply filters
-        search_text = self.search_input.text().strip()
-        if search_text:
-            query += " AND items.name LIKE ?"
-            params.append(f"%{search_text}%")
-
-        box_id = self.box_filter.currentData()
-        if box_id:
-            query += " AND items.box_id = ?"
-            params.append(box_id)
-
-        query += " ORDER BY items.id"
-
-        self.parent.cursor.execute(query, params)
-        items = self.parent.cursor.fetchall()
-
-        for row_idx, (item_id, name, box_name, quantity, box_id) in enumerate(items):
-            self.table.insertRow(row_idx)
-
-            # ID
-            id_item = QTableWidgetItem(str(item_id))
-            id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row_idx, 0, id_item)
-
-            # Name
-            name_item = QTableWidgetItem(name)
-            name_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row_idx, 1, name_item)
-
-            # Box
-            box_item = QTableWidgetItem(box_name or "N/A")
-            box_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row_idx, 2, box_item)
-
-            # Quantity
-            qty_item = QTableWidgetItem(str(quantity))
-            qty_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row_idx, 3, qty_item)
-
-            # Actions
-            actions_widget = QWidget()
-            actions_widget.setStyleSheet("QWidget { background: transparent; border: none; }")
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.setContentsMargins(0, 0, 0, 0)
-            actions_layout.setSpacing(5)
-            actions_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-            edit_btn = QPushButton(self.translator.tr('btn_edit'))
-            edit_btn.setFixedSize(45, 22)
-            edit_btn.setStyleSheet(
-                f"""
-                QPushButton {{
-                    background-color: {ModernStyle.PRIMARY};
-                    color: {ModernStyle.TEXT};
-                    border: none;
-                    padding: 1px;
-                    border-radius: 4px;
-                    font-size: 11px;
-                }}
-                QPushButton:hover {{
-                    background-color: #2da35f;
-                }}
-            """
-            )
-            edit_btn.clicked.connect(
-                lambda checked, i=item_id, n=name, q=quantity, b=box_id: self.edit_item(
-                    i, n, q, b
-                )
-            )
-            actions_layout.addWidget(edit_btn)
-
-            delete_btn = QPushButton(self.translator.tr('btn_delete'))
-            delete_btn.setFixedSize(45, 22)
-            delete_btn.setStyleSheet(
-                f"""
-                QPushButton {{
-                    background-color: {ModernStyle.DANGER};
-                    color: {ModernStyle.TEXT};
-                    border: none;
-                    padding: 1px;
-                    border-radius: 4px;
-                    height: 10px;
-                    font-size: 11px;
-                }}
-                QPushButton:hover {{
-                    background-color: #d63d3d;
-                }}
-            """
-            )
-            delete_btn.clicked.connect(lambda checked, i=item_id: self.delete_item(i))
-            actions_layout.addWidget(delete_btn)
-
-            self.table.setCellWidget(row_idx, 4, actions_widget)
+        self.loaded_filters = self.filter_key()
+        search_text, box_id = self.loaded_filters
+        match = self.parent.fts_query(search_text)
+        if match:
+            search, search_param = "fts", match
+        elif search_text:
+            search, search_param = "like", f"%{search_text}%"
+        else:
+            search, search_param = None, None
+        params = [value for value in (search_param, box_id) if value]
+
+        self.parent.cursor.execute(ITEM_QUERIES[search, bool(box_id)], params)
+        # Kept for the row action delegate, which reports clicks by row
+        items = self.rows = self.parent.cursor.fetchall()
+
+        # Size the table once and fill it with repaints and signals off
+        center = Qt.AlignmentFlag.AlignCenter
+        self.table.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.table):
+                self.table.setRowCount(0)
+                self.table.setRowCount(len(items))
+                for row_idx, (item_id, name, box_name, quantity, box_id) in enumerate(items):
+                    # ID
+                    id_item = QTableWidgetItem(str(item_id))
+                    id_item.setTextAlignment(center)
+                    self.table.setItem(row_idx, 0, id_item)
+
+                    # Name
+                    name_item = QTableWidgetItem(name)
+                    name_item.setTextAlignment(center)
+                    self.table.setItem(row_idx, 1, name_item)
+
+                    # Box
+                    box_item = QTableWidgetItem(box_name or "N/A")
+                    box_item.setTextAlignment(center)
+                    self.table.setItem(row_idx, 2, box_item)
+
+                    # Quantity
+                    qty_item = QTableWidgetItem(str(quantity))
+                    qty_item.setTextAlignment(center)
+                    self.table.setItem(row_idx, 3, qty_item)
+        finally:
+            self.table.setUpdatesEnabled(True)
+
+    def on_edit_requested(self, row):
+        """Edit the item shown in a table row."""
+        item_id, name, _, quantity, box_id = self.rows[row]
+        self.edit_item(item_id, name, quantity, box_id)
+
+    def on_delete_requested(self, row):
+        """Delete the item shown in a table row."""
+        self.delete_item(self.rows[row][0])
 
     def clear_filters(self):
         """Clear all filters."""
@@ -228,35 +249,34 @@ class ItemsTab(QWidget):
             )
             return
 
+        from .dialogs import EditItemDialog
+
         dialog = EditItemDialog(self, self.parent.cursor)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             name, box_id, quantity = dialog.result
             try:
-                self.parent.cursor.execute(
-                    "INSERT INTO items (name, box_id, quantity) VALUES (?, ?, ?)",
-                    (name, box_id, quantity),
-                )
-                item_id = self.parent.cursor.lastrowid
-                self.parent.conn.commit()
-
-                # Get box name for logging
-                self.parent.cursor.execute("SELECT name FROM boxes WHERE id = ?", (box_id,))
-                box_name = self.parent.cursor.fetchone()[0]
-
-                # Log the action
-                self.parent.log_action(
-                    action="CREATE",
-                    entity_type="ITEM",
-                    entity_id=item_id,
-                    entity_name=name,
-                    details=f"Added {quantity} units to box '{box_name}'"
-                )
+                box_name = self.box_name(box_id)
+
+                # Item and audit row commit together; rolled back on error
+                with self.parent.transaction():
+                    self.parent.cursor.execute(
+                        "INSERT INTO items (name, box_id, quantity) VALUES (?, ?, ?)",
+                        (name, box_id, quantity),
+                    )
+                    item_id = self.parent.cursor.lastrowid
+                    self.parent.log_action(
+                        action="CREATE",
+                        entity_type="ITEM",
+                        entity_id=item_id,
+                        entity_name=name,
+                        details=f"Added {quantity} units to box '{box_name}'"
+                    )
+                self.parent.data_version += 1
 
                 QMessageBox.information(self, "Success", "Item added successfully")
                 self.load_items()
                 self.load_box_filter()
             except sqlite3.Error as e:
-                self.parent.conn.rollback()
                 QMessageBox.critical(self, "Error", f"Database error: {e}")
 
     def edit_item(self, item_id, name, quantity, box_id):
@@ -264,19 +284,13 @@ class ItemsTab(QWidget):
         item_data = (item_id, name, None, quantity, box_id)
         old_values = {"name": name, "quantity": quantity, "box_id": box_id}
 
+        from .dialogs import EditItemDialog
+
         dialog = EditItemDialog(self, self.parent.cursor, item_data)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             new_name, new_box_id, new_quantity = dialog.result
             try:
-                self.parent.cursor.execute(
-                    "UPDATE items SET name = ?, box_id = ?, quantity = ? WHERE id = ?",
-                    (new_name, new_box_id, new_quantity, item_id),
-                )
-                self.parent.conn.commit()
-
-                # Get box names for logging
-                self.parent.cursor.execute("SELECT name FROM boxes WHERE id = ?", (new_box_id,))
-                new_box_name = self.parent.cursor.fetchone()[0]
+                new_box_name = self.box_name(new_box_id)
 
                 # Build change details
                 changes = []
@@ -285,25 +299,32 @@ class ItemsTab(QWidget):
                 if old_values["quantity"] != new_quantity:
                     changes.append(f"quantity: {old_values['quantity']} → {new_quantity}")
                 if old_values["box_id"] != new_box_id:
-                    self.parent.cursor.execute("SELECT name FROM boxes WHERE id = ?", (old_values["box_id"],))
-                    old_box_name = self.parent.cursor.fetchone()[0]
+                    old_box_name = self.box_name(old_values["box_id"])
                     changes.append(f"box: '{old_box_name}' → '{new_box_name}'")
 
-                # Log the action
-                self.parent.log_action(
-                    action="UPDATE",
-                    entity_type="ITEM",
-                    entity_id=item_id,
-                    entity_name=new_name,
-                    details=", ".join(changes) if changes else "No changes",
-                    old_value=str(old_values),
-                    new_value=f"{{'name': '{new_name}', 'quantity': {new_quantity}, 'box_id': {new_box_id}}}"
-                )
+                # Update and audit row commit together; rolled back on error
+                with self.parent.transaction():
+                    self.parent.cursor.execute(
+                        "UPDATE items SET name = ?, box_id = ?, quantity = ? WHERE id = ?",
+                        (new_name, new_box_id, new_quantity, item_id),
+                    )
+                    self.parent.log_action(
+                        action="UPDATE",
+                        entity_type="ITEM",
+                        entity_id=item_id,
+                        entity_name=new_name,
+                        details=", ".join(changes) if changes else "No changes",
+                        old_value=json.dumps(old_values, ensure_ascii=False),
+                        new_value=json.dumps(
+                            {"name": new_name, "quantity": new_quantity, "box_id": new_box_id},
+                            ensure_ascii=False,
+                        ),
+                    )
+                self.parent.data_version += 1
 
                 QMessageBox.information(self, "Success", "Item updated successfully")
                 self.load_items()
             except sqlite3.Error as e:
-                self.parent.conn.rollback()
                 QMessageBox.critical(self, "Error", f"Database error: {e}")
 
     def delete_item(self, item_id):
@@ -328,20 +349,19 @@ class ItemsTab(QWidget):
                 item_data = self.parent.cursor.fetchone()
                 item_name, quantity, box_name = item_data if item_data else ("Unknown", 0, "Unknown")
 
-                self.parent.cursor.execute("DELETE FROM items WHERE id = ?", (item_id,))
-                self.parent.conn.commit()
-
-                # Log the action
-                self.parent.log_action(
-                    action="DELETE",
-                    entity_type="ITEM",
-                    entity_id=item_id,
-                    entity_name=item_name,
-                    details=f"Deleted {quantity} units from box '{box_name}'"
-                )
+                # Delete and audit row commit together; rolled back on error
+                with self.parent.transaction():
+                    self.parent.cursor.execute("DELETE FROM items WHERE id = ?", (item_id,))
+                    self.parent.log_action(
+                        action="DELETE",
+                        entity_type="ITEM",
+                        entity_id=item_id,
+                        entity_name=item_name,
+                        details=f"Deleted {quantity} units from box '{box_name}'"
+                    )
+                self.parent.data_version += 1
 
                 QMessageBox.information(self, "Success", "Item deleted successfully")
                 self.load_items()
             except sqlite3.Error as e:
-                self.parent.conn.rollback()
                 QMessageBox.critical(self, "Error", f"Database error: {e}")
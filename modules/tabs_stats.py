@@ -2,11 +2,10 @@
 Statistics Tab
 """
 
-import matplotlib
+import logging
+import sqlite3
+from functools import lru_cache
 
-matplotlib.use("Qt5Agg")  # Use Qt backend for matplotlib
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -16,20 +15,124 @@ from PyQt6.QtWidgets import (
     QScrollArea,
     QGridLayout,
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 
-from .styles import ModernStyle
+from .styles import ModernStyle, bold_font
 from . import get_translator
 
+# Box/item counts come from the trigger-maintained entity_counts table
+STATS_TOTALS_SQL = """
+    SELECT
+        (SELECT n FROM entity_counts WHERE entity = 'boxes'),
+        (SELECT n FROM entity_counts WHERE entity = 'items'),
+        (SELECT COALESCE(SUM(quantity), 0) FROM items)
+"""
+
+# Chart label: box name cut to 15 characters by SQLite
+BOX_LABEL_SQL = (
+    "CASE WHEN length(boxes.name) > 15 "
+    "THEN substr(boxes.name, 1, 15) || '...' ELSE boxes.name END"
+)
+
+# Top 10 boxes by item count / total quantity (fixed strings stay in the statement cache)
+ITEMS_PER_BOX_SQL = f"""
+    SELECT {BOX_LABEL_SQL}, COUNT(items.id) as item_count
+    FROM boxes
+    LEFT JOIN items ON boxes.id = items.box_id
+    GROUP BY boxes.id, boxes.name
+    ORDER BY item_count DESC
+    LIMIT 10
+"""
+
+QUANTITY_PER_BOX_SQL = f"""
+    SELECT {BOX_LABEL_SQL}, COALESCE(SUM(items.quantity), 0) as total_quantity
+    FROM boxes
+    LEFT JOIN items ON boxes.id = items.box_id
+    GROUP BY boxes.id, boxes.name
+    ORDER BY total_quantity DESC
+    LIMIT 10
+"""
+
+
+@lru_cache(maxsize=None)
+def accent_stylesheets(color):
+    """Return the (value label, colour bar) stylesheets for a stat card colour."""
+    return (
+        f"color: {color}; border: none;",
+        f"background-color: {color}; border-radius: 2px;",
+    )
+
+
+def get_statistics(cursor):
+    """Run the statistics queries on cursor and return them as a dict."""
+    # Summary totals in a single round-trip
+    cursor.execute(STATS_TOTALS_SQL)
+    total_boxes, total_items, total_quantity = cursor.fetchone()
+    stats = {
+        "total_boxes": total_boxes,
+        "total_items": total_items,
+        "total_quantity": total_quantity,
+    }
+
+    cursor.execute(ITEMS_PER_BOX_SQL)
+    stats["items_per_box"] = cursor.fetchall()
+
+    cursor.execute(QUANTITY_PER_BOX_SQL)
+    stats["quantity_per_box"] = cursor.fetchall()
+
+    return stats
+
+
+class StatsSignals(QObject):
+    """Signals emitted by StatsWorker back on the GUI thread."""
+
+    finished = pyqtSignal(dict)
+    failed = pyqtSignal(str)
+
+
+class StatsWorker(QRunnable):
+    """Gathers inventory statistics on a pool thread."""
+
+    def __init__(self, db_path):
+        super().__init__()
+        self.db_path = db_path
+        self.signals = StatsSignals()
+
+    def run(self):
+        try:
+            # Dedicated read-only connection; the GUI connection stays on its thread
+            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+            try:
+                stats = get_statistics(conn.cursor())
+            finally:
+                conn.close()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(stats)
+
 
 class StatsTab(QWidget):
     """Tab for displaying inventory statistics and charts."""
 
+    # Bars per chart; matches the LIMIT of the per-box queries
+    MAX_BARS = 10
+
+    # Chart colours and frame stylesheets, built once per theme
+    _color_cache = {}
+    _stylesheet_cache = {}
+
     def __init__(self, parent):
         super().__init__(parent)
         self.parent = parent
         self.translator = get_translator()
+        self.logger = logging.getLogger(__name__)
+        # Statistics query in flight, if any
+        self._stats_worker = None
+        # Set when a refresh is requested while a query is already running
+        self._refresh_pending = False
+        # parent.data_version the shown statistics were gathered at
+        self._data_version = -1
         self.setup_ui()
 
     def setup_ui(self):
@@ -47,7 +150,7 @@ class StatsTab(QWidget):
 
         # Title
         title = QLabel(self.translator.tr("stats_title"))
-        title.setFont(QFont("Arial", 18, QFont.Weight.Bold))
+        title.setFont(bold_font(18))
         main_layout.addWidget(title)
 
         # Scroll area for content
@@ -94,13 +197,23 @@ class StatsTab(QWidget):
         charts_layout = QGridLayout()
         charts_layout.setSpacing(15)
 
+        colors = self.get_chart_colors()
+
         # Items per box chart
-        self.items_per_box_canvas = self.create_chart()
+        self.items_per_box_canvas = self.create_chart(
+            self.translator.tr("stats_items_per_box"),
+            self.translator.tr("stats_number_of_items"),
+            colors["bar_items"],
+        )
         items_chart_container = self.create_chart_container(self.items_per_box_canvas)
         charts_layout.addWidget(items_chart_container, 0, 0)
 
         # Quantity per box chart
-        self.quantity_per_box_canvas = self.create_chart()
+        self.quantity_per_box_canvas = self.create_chart(
+            self.translator.tr("stats_quantity_per_box"),
+            self.translator.tr("stats_total_quantity"),
+            colors["bar_quantity"],
+        )
         quantity_chart_container = self.create_chart_container(
             self.quantity_per_box_canvas
         )
@@ -114,22 +227,13 @@ class StatsTab(QWidget):
 
         self.setLayout(main_layout)
 
-        self.refresh_stats()
-
     def create_stat_card(self, title, value, color):
         """Create a flat minimalistic statistics card widget."""
         card = QFrame()
 
         # Simple flat design without padding in stylesheet
-        card.setStyleSheet(
-            f"""
-            QFrame {{
-                background-color: {ModernStyle.SURFACE};
-                border: 1px solid {ModernStyle.BORDER};
-                border-radius: 8px;
-            }}
-        """
-        )
+        stylesheets = self.get_stylesheets()
+        card.setStyleSheet(stylesheets["card"])
         card.setMinimumWidth(200)
         card.setMaximumWidth(250)
         card.setFixedHeight(120)
@@ -140,20 +244,21 @@ class StatsTab(QWidget):
 
         # Title label
         title_label = QLabel(title.upper())
-        title_label.setFont(QFont("Arial", 9, QFont.Weight.Bold))
-        title_label.setStyleSheet(f"color: {ModernStyle.TEXT_SECONDARY}; border: none;")
+        title_label.setFont(bold_font(9))
+        title_label.setStyleSheet(stylesheets["card_title"])
         layout.addWidget(title_label)
 
         # Value label
         value_label = QLabel(value)
-        value_label.setFont(QFont("Arial", 38, QFont.Weight.Bold))
-        value_label.setStyleSheet(f"color: {color}; border: none;")
+        value_label.setFont(bold_font(38))
+        value_style, bar_style = accent_stylesheets(color)
+        value_label.setStyleSheet(value_style)
         layout.addWidget(value_label)
 
         # Color bar
         bar = QFrame()
         bar.setFixedHeight(4)
-        bar.setStyleSheet(f"background-color: {color}; border-radius: 2px;")
+        bar.setStyleSheet(bar_style)
         layout.addWidget(bar)
 
         layout.addStretch()
@@ -166,315 +271,228 @@ class StatsTab(QWidget):
 
         return card
 
-    def create_chart(self):
-        """Create a matplotlib figure canvas."""
-        figure = Figure(figsize=(6, 4.5), facecolor="none")
+    @staticmethod
+    def set_card_value(card, value):
+        """Show value on a stat card, skipping the relayout when it is unchanged."""
+        text = str(value)
+        if card.value_label.text() != text:
+            card.value_label.setText(text)
+
+    def create_chart(self, title, ylabel, bar_color):
+        """Create a bar chart canvas; chrome is styled once, bars are updated in place."""
+        # matplotlib is slow to import; load it when the Stats tab is first built
+        import matplotlib
+
+        matplotlib.use("QtAgg")  # Qt backend; binds to the already-imported PyQt6
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+
+        colors = self.get_chart_colors()
+        text_color = colors["text"]
+        grid_color = colors["grid"]
+
+        # Constrained layout is solved at draw time, only when geometry changes
+        figure = Figure(
+            figsize=(6, 4.5), facecolor=colors["background"], constrained_layout=True
+        )
         canvas = FigureCanvas(figure)
         canvas.setMinimumHeight(360)
-        return canvas
-
-    def create_chart_container(self, canvas):
-        """Create a container frame with border for the chart."""
-        container = QFrame()
-        container.setStyleSheet(
-            f"""
-            QFrame {{
-                background-color: {ModernStyle.SURFACE};
-                border: 1px solid {ModernStyle.BORDER};
-                border-radius: 8px;
-                padding: 10px;
-            }}
-        """
-        )
 
-        layout = QVBoxLayout(container)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(canvas)
-
-        return container
-
-    def refresh_stats(self):
-        """Refresh all statistics and charts."""
-        try:
-            # Get statistics from database
-            stats = self.get_statistics()
-
-            # Update summary cards
-            self.total_boxes_card.value_label.setText(str(stats["total_boxes"]))
-            self.total_items_card.value_label.setText(str(stats["total_items"]))
-            self.total_quantity_card.value_label.setText(str(stats["total_quantity"]))
-
-            # Force repaint
-            self.total_boxes_card.update()
-            self.total_items_card.update()
-            self.total_quantity_card.update()
-
-            # Update charts
-            self.update_items_per_box_chart(stats["items_per_box"])
-            self.update_quantity_per_box_chart(stats["quantity_per_box"])
-        except Exception as e:
-            print(f"Error refreshing stats: {e}")
-            import traceback
-
-            traceback.print_exc()
-
-    def get_statistics(self):
-        """Get statistics from database."""
-        stats = {}
-
-        # Total boxes
-        self.parent.cursor.execute("SELECT COUNT(*) FROM boxes")
-        stats["total_boxes"] = self.parent.cursor.fetchone()[0]
-
-        # Total items (unique items)
-        self.parent.cursor.execute("SELECT COUNT(*) FROM items")
-        stats["total_items"] = self.parent.cursor.fetchone()[0]
-
-        # Total quantity (sum of all quantities)
-        self.parent.cursor.execute("SELECT COALESCE(SUM(quantity), 0) FROM items")
-        stats["total_quantity"] = self.parent.cursor.fetchone()[0]
-
-        # Items per box
-        self.parent.cursor.execute(
-            """
-            SELECT boxes.name, COUNT(items.id) as item_count
-            FROM boxes
-            LEFT JOIN items ON boxes.id = items.box_id
-            GROUP BY boxes.id, boxes.name
-            ORDER BY item_count DESC
-            LIMIT 10
-        """
-        )
-        stats["items_per_box"] = self.parent.cursor.fetchall()
-
-        # Quantity per box
-        self.parent.cursor.execute(
-            """
-            SELECT boxes.name, COALESCE(SUM(items.quantity), 0) as total_quantity
-            FROM boxes
-            LEFT JOIN items ON boxes.id = items.box_id
-            GROUP BY boxes.id, boxes.name
-            ORDER BY total_quantity DESC
-            LIMIT 10
-        """
-        )
-        stats["quantity_per_box"] = self.parent.cursor.fetchall()
-
-        return stats
-
-    def update_items_per_box_chart(self, data):
-        """Update the items per box bar chart."""
-        # Clear previous chart
-        figure = self.items_per_box_canvas.figure
-        figure.clear()
-
-        # Determine colors based on theme
-        if ModernStyle.current_theme == "dark":
-            bar_color = ModernStyle.PRIMARY
-            text_color = ModernStyle.TEXT
-            grid_color = ModernStyle.BORDER
-            bg_color = ModernStyle.BACKGROUND
-            face_color = ModernStyle.SURFACE
-        else:
-            bar_color = ModernStyle.PRIMARY
-            text_color = ModernStyle.TEXT
-            grid_color = ModernStyle.BORDER
-            bg_color = ModernStyle.BACKGROUND
-            face_color = ModernStyle.SURFACE
-
-        # Set figure background
-        figure.patch.set_facecolor(bg_color)
-
-        if not data:
-            ax = figure.add_subplot(111)
-            ax.text(
-                0.5,
-                0.5,
-                self.translator.tr("stats_no_data"),
-                ha="center",
-                va="center",
-                fontsize=11,
-                color=text_color,
-            )
-            ax.set_xlim(0, 1)
-            ax.set_ylim(0, 1)
-            ax.axis("off")
-            ax.set_facecolor(face_color)
-            self.items_per_box_canvas.draw()
-            return
-
-        # Extract data
-        box_names = [name[:15] + "..." if len(name) > 15 else name for name, _ in data]
-        item_counts = [count for _, count in data]
-
-        # Create bar chart
         ax = figure.add_subplot(111)
-        ax.set_facecolor(face_color)
-
-        bars = ax.bar(
-            box_names,
-            item_counts,
-            color=bar_color,
-            alpha=0.85,
-            edgecolor=bar_color,
-            linewidth=2,
-        )
-
-        # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(
-                bar.get_x() + bar.get_width() / 2.0,
-                height,
-                f"{int(height)}",
-                ha="center",
-                va="bottom",
-                fontsize=10,
-                fontweight="bold",
-                color=text_color,
-            )
+        ax.set_facecolor(colors["face"])
 
+        # Static chrome: titles, ticks, grid and spines never change between refreshes
         ax.set_xlabel(
             self.translator.tr("stats_box_name"),
             fontsize=11,
             color=text_color,
             fontweight="bold",
         )
-        ax.set_ylabel(
-            self.translator.tr("stats_number_of_items"),
-            fontsize=11,
-            color=text_color,
-            fontweight="bold",
-        )
-        ax.set_title(
-            self.translator.tr("stats_items_per_box"),
-            fontsize=13,
-            fontweight="bold",
-            color=text_color,
-            pad=15,
-        )
+        ax.set_ylabel(ylabel, fontsize=11, color=text_color, fontweight="bold")
+        ax.set_title(title, fontsize=13, fontweight="bold", color=text_color, pad=15)
         ax.tick_params(axis="x", rotation=45, labelsize=9, colors=text_color)
         ax.tick_params(axis="y", labelsize=10, colors=text_color)
         ax.grid(True, alpha=0.15, color=grid_color, linestyle="--", linewidth=1)
-
-        # Set spine colors to match theme
         for spine in ax.spines.values():
             spine.set_edgecolor(grid_color)
             spine.set_linewidth(2)
 
-        # Add a bit of room at the top for value labels
-        ax.set_ylim(bottom=0, top=max(item_counts) * 1.1 if item_counts else 1)
-
-        figure.tight_layout()
-        self.items_per_box_canvas.draw()
-
-    def update_quantity_per_box_chart(self, data):
-        """Update the quantity per box bar chart."""
-        # Clear previous chart
-        figure = self.quantity_per_box_canvas.figure
-        figure.clear()
-
-        # Determine colors based on theme
-        if ModernStyle.current_theme == "dark":
-            bar_color = "#0d6efd"  # Blue
-            text_color = ModernStyle.TEXT
-            grid_color = ModernStyle.BORDER
-            bg_color = ModernStyle.BACKGROUND
-            face_color = ModernStyle.SURFACE
-        else:
-            bar_color = "#0d6efd"  # Blue
-            text_color = ModernStyle.TEXT
-            grid_color = ModernStyle.BORDER
-            bg_color = ModernStyle.BACKGROUND
-            face_color = ModernStyle.SURFACE
-
-        # Set figure background
-        figure.patch.set_facecolor(bg_color)
-
-        if not data:
-            ax = figure.add_subplot(111)
-            ax.text(
-                0.5,
-                0.5,
-                self.translator.tr("stats_no_data"),
-                ha="center",
-                va="center",
-                fontsize=11,
-                color=text_color,
-            )
-            ax.set_xlim(0, 1)
-            ax.set_ylim(0, 1)
-            ax.axis("off")
-            ax.set_facecolor(face_color)
-            self.quantity_per_box_canvas.draw()
-            return
-
-        # Extract data
-        box_names = [name[:15] + "..." if len(name) > 15 else name for name, _ in data]
-        quantities = [qty for _, qty in data]
-
-        # Create bar chart
-        ax = figure.add_subplot(111)
-        ax.set_facecolor(face_color)
-
+        # Data artists are built once and updated in place on every refresh
         bars = ax.bar(
-            box_names,
-            quantities,
+            range(self.MAX_BARS),
+            [0] * self.MAX_BARS,
             color=bar_color,
             alpha=0.85,
             edgecolor=bar_color,
             linewidth=2,
         )
-
-        # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(
-                bar.get_x() + bar.get_width() / 2.0,
-                height,
-                f"{int(height)}",
-                ha="center",
-                va="bottom",
-                fontsize=10,
-                fontweight="bold",
-                color=text_color,
-            )
-
-        ax.set_xlabel(
-            self.translator.tr("stats_box_name"),
-            fontsize=11,
-            color=text_color,
+        canvas.ax = ax
+        canvas.bars = bars
+        # Value annotations anchored to the bar tops; text and anchor set per refresh
+        canvas.value_texts = ax.bar_label(
+            bars,
+            labels=[""] * self.MAX_BARS,
+            padding=2,
+            fontsize=10,
             fontweight="bold",
-        )
-        ax.set_ylabel(
-            self.translator.tr("stats_total_quantity"),
-            fontsize=11,
             color=text_color,
-            fontweight="bold",
         )
-        ax.set_title(
-            self.translator.tr("stats_quantity_per_box"),
-            fontsize=13,
-            fontweight="bold",
+        canvas.no_data_text = ax.text(
+            0.5,
+            0.5,
+            self.translator.tr("stats_no_data"),
+            ha="center",
+            va="center",
+            fontsize=11,
             color=text_color,
-            pad=15,
+            transform=ax.transAxes,
+            visible=False,
         )
-        ax.tick_params(axis="x", rotation=45, labelsize=9, colors=text_color)
-        ax.tick_params(axis="y", labelsize=10, colors=text_color)
-        ax.grid(True, alpha=0.15, color=grid_color, linestyle="--", linewidth=1)
+        return canvas
 
-        # Set spine colors to match theme
-        for spine in ax.spines.values():
-            spine.set_edgecolor(grid_color)
-            spine.set_linewidth(2)
+    def create_chart_container(self, canvas):
+        """Create a container frame with border for the chart."""
+        container = QFrame()
+        container.setStyleSheet(self.get_stylesheets()["chart_container"])
+
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(canvas)
 
-        # Add a bit of room at the top for value labels
-        ax.set_ylim(bottom=0, top=max(quantities) * 1.1 if quantities else 1)
+        return container
 
-        figure.tight_layout()
-        self.quantity_per_box_canvas.draw()
+    def refresh_stats(self):
+        """Gather statistics on a pool thread; apply_stats updates the UI."""
+        if self._stats_worker is not None:
+            # Coalesce into a single follow-up run
+            self._refresh_pending = True
+            return
+        self._data_version = self.parent.data_version
+        self._stats_worker = StatsWorker(self.parent.DB_PATH)
+        self._stats_worker.signals.finished.connect(self.apply_stats)
+        self._stats_worker.signals.failed.connect(self.on_stats_failed)
+        QThreadPool.globalInstance().start(self._stats_worker)
+
+    def apply_stats(self, stats):
+        """Update summary cards and charts with freshly gathered statistics."""
+        self.logger.debug(
+            "Stats loaded: boxes=%s items=%s quantity=%s",
+            stats["total_boxes"],
+            stats["total_items"],
+            stats["total_quantity"],
+        )
+        # Hold repaints until cards and charts are all updated
+        self.setUpdatesEnabled(False)
+        try:
+            # Update summary cards
+            self.set_card_value(self.total_boxes_card, stats["total_boxes"])
+            self.set_card_value(self.total_items_card, stats["total_items"])
+            self.set_card_value(self.total_quantity_card, stats["total_quantity"])
+
+            # Update charts
+            self.update_bar_chart(self.items_per_box_canvas, stats["items_per_box"])
+            self.update_bar_chart(
+                self.quantity_per_box_canvas, stats["quantity_per_box"]
+            )
+            # Both renders are queued together and run in one event-loop pass
+            self.items_per_box_canvas.draw_idle()
+            self.quantity_per_box_canvas.draw_idle()
+        except Exception:
+            self.logger.exception("Error refreshing stats")
+        finally:
+            self.setUpdatesEnabled(True)
+        self.finish_stats_worker()
+
+    def on_stats_failed(self, error):
+        """Report a statistics query that failed on the worker thread."""
+        self.logger.error("Error refreshing stats: %s", error)
+        # Retry on the next show
+        self._data_version = -1
+        self.finish_stats_worker()
+
+    def finish_stats_worker(self):
+        """Drop the finished worker and run a refresh requested meanwhile."""
+        self._stats_worker = None
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self.refresh_stats()
+
+    @classmethod
+    def get_stylesheets(cls):
+        """Return the card and chart container stylesheets for the current theme."""
+        stylesheets = cls._stylesheet_cache.get(ModernStyle.current_theme)
+        if stylesheets is None:
+            stylesheets = cls._stylesheet_cache[ModernStyle.current_theme] = {
+                "card": f"""
+            QFrame {{
+                background-color: {ModernStyle.SURFACE};
+                border: 1px solid {ModernStyle.BORDER};
+                border-radius: 8px;
+            }}
+        """,
+                "card_title": f"color: {ModernStyle.TEXT_SECONDARY}; border: none;",
+                "chart_container": f"""
+            QFrame {{
+                background-color: {ModernStyle.SURFACE};
+                border: 1px solid {ModernStyle.BORDER};
+                border-radius: 8px;
+                padding: 10px;
+            }}
+        """,
+            }
+        return stylesheets
+
+    @classmethod
+    def get_chart_colors(cls):
+        """Return the chart colour map for the current theme."""
+        colors = cls._color_cache.get(ModernStyle.current_theme)
+        if colors is None:
+            colors = cls._color_cache[ModernStyle.current_theme] = {
+                "bar_items": ModernStyle.PRIMARY,
+                "bar_quantity": "#0d6efd",  # Blue
+                "text": ModernStyle.TEXT,
+                "grid": ModernStyle.BORDER,
+                "background": ModernStyle.BACKGROUND,
+                "face": ModernStyle.SURFACE,
+            }
+        return colors
+
+    def update_bar_chart(self, canvas, data):
+        """Move a chart's persistent bars and value labels to new (name, value) rows.
+
+        Only data artists are touched; the caller schedules the draw.
+        """
+        ax = canvas.ax
+        if data:
+            ax.set_axis_on()
+        else:
+            ax.set_axis_off()
+        ax.title.set_visible(bool(data))
+        canvas.no_data_text.set_visible(not data)
+
+        # Split rows into columns in one pass; names arrive already truncated
+        box_names, values = zip(*data) if data else ((), ())
+
+        # Bars beyond the number of rows are hidden rather than removed
+        for i, (bar, text) in enumerate(zip(canvas.bars, canvas.value_texts)):
+            visible = i < len(values)
+            bar.set_visible(visible)
+            text.set_visible(visible)
+            if not visible:
+                continue
+            bar.set_height(values[i])
+            text.xy = (bar.get_x() + bar.get_width() / 2.0, values[i])
+            text.set_text(f"{int(values[i])}")
+
+        if data:
+            ax.set_xticks(range(len(box_names)))
+            ax.set_xticklabels(box_names)
+            ax.set_xlim(-0.5, len(box_names) - 0.5)
+            # Add a bit of room at the top for value labels
+            ax.set_ylim(bottom=0, top=max(values) * 1.1 or 1)
 
     def showEvent(self, event):
-        """Refresh stats when tab is shown."""
+        """Refresh stats when tab is shown and the inventory has changed since."""
         super().showEvent(event)
-        self.refresh_stats()
+        if self._data_version != self.parent.data_version:
+            self.refresh_stats()
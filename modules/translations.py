@@ -823,22 +823,36 @@ class Translations:
         },
     }
 
+    # Flattened key -> text tables, built once per language
+    _tables = {}
+
     def __init__(self, language='en'):
         """Initialize with default language."""
         self.current_language = language
+        self.strings = self.get_table(language)
+
+    @classmethod
+    def get_table(cls, language):
+        """Return the key -> text table for a language, with English fallbacks."""
+        table = cls._tables.get(language)
+        if table is None:
+            table = cls._tables[language] = {
+                key: values.get(language, values.get('en', key))
+                for key, values in cls.STRINGS.items()
+            }
+        return table
 
     def set_language(self, language):
         """Change the current language."""
         if language in self.LANGUAGES:
             self.current_language = language
+            self.strings = self.get_table(language)
             return True
         return False
 
     def tr(self, key):
         """Translate a key to the current language."""
-        if key in self.STRINGS:
-            return self.STRINGS[key].get(self.current_language, self.STRINGS[key].get('en', key))
-        return key
+        return self.strings.get(key, key)
 
     def get_languages(self):
         """Get available languages."""